@@ -0,0 +1,216 @@
+from functools import lru_cache
+from pathlib import Path
+
+import manim
+from manim import *
+from manim.utils.bezier import bezier_remap
+import numpy as np
+
+from diskcache import DiskCache
+from vertexcolor import fit_vertex_colors, has_vertex_colors, interpolate_vertex_colors
+
+ALIGNMENT_CACHE_BYTES = 64 * 1024 ** 2
+# Points per cubic curve, plans are only made for cubic VMobjects
+NPPCC = 4
+
+_alignment_cache = None
+# Plans already loaded or computed by this process
+_plans = {}
+
+
+def get_alignment_cache():
+    """The process-wide cache of alignment plans, next to the glyph cache"""
+    global _alignment_cache
+    if _alignment_cache is None:
+        _alignment_cache = DiskCache(Path(config.media_dir) / "alignment", ALIGNMENT_CACHE_BYTES)
+    return _alignment_cache
+
+
+@lru_cache(maxsize=None)
+def remap_plan(num_curves, new_num_curves):
+    """Source point index and weight of each point of bezier_remap, shape (n, 4)
+
+    Every point of a remapped curve is a combination of the 4 control points
+    of one source curve, found by remapping the identity.
+    """
+    basis = np.eye(num_curves * NPPCC).reshape(num_curves, NPPCC, -1)
+    remapped = bezier_remap(basis, new_num_curves).reshape(new_num_curves * NPPCC, -1)
+    source_curves = np.repeat(
+        (np.arange(new_num_curves) * num_curves) // new_num_curves, NPPCC,
+    )
+    index = source_curves[:, None] * NPPCC + np.arange(NPPCC)
+    weights = np.take_along_axis(remapped, index, axis=1)
+    return index, weights
+
+
+def subpath_ranges(vmobject):
+    """(start, length) of each subpath, without the useless points at its end
+
+    Same subpaths and trimming as VMobject.align_points.
+    """
+    ranges = []
+    start = 0
+    for path in vmobject.get_subpaths():
+        length = len(path)
+        while length > NPPCC and vmobject.consider_points_equals(
+            path[length - NPPCC:length], path[length - NPPCC - 1],
+        ):
+            length -= NPPCC
+        ranges.append((start, length))
+        start += len(path)
+    return tuple(ranges)
+
+
+def pair_plan(size1, ranges1, size2, ranges2):
+    """Index and weights of both sides of a VMobject.align_points"""
+    plans = ([], [])
+    for n in range(max(len(ranges1), len(ranges2))):
+        sides = [
+            ranges[n] if n < len(ranges) else None
+            for ranges in (ranges1, ranges2)
+        ]
+        # Curves are added to the shorter subpath until both have as many
+        num_curves = max(NPPCC if side is None else side[1] for side in sides) // NPPCC
+        for plan, side, size in zip(plans, sides, (size1, size2)):
+            if side is None:
+                # Null subpath at the last point of the mobject
+                index, weights = remap_plan(1, num_curves)
+                index = np.full_like(index, size - 1)
+            else:
+                start, length = side
+                index, weights = remap_plan(length // NPPCC, num_curves)
+                index = index + start
+            plan.append((index, weights))
+    return [
+        tuple(np.concatenate(arrays) for arrays in zip(*plan)) for plan in plans
+    ]
+
+
+def can_plan(vmobject):
+    """Whether align_points would only remap the curves of its subpaths"""
+    return (
+        vmobject.n_points_per_cubic_curve == NPPCC
+        and vmobject.has_points()
+        and not vmobject.has_new_path_started()
+    )
+
+
+def align_structure(mobject1, mobject2, pairs):
+    """Mobject.align_data without the point alignment of VMobject pairs.
+
+    The VMobject pairs whose points need aligning are appended to pairs,
+    everything else is aligned as manim does.
+    """
+    mobject1.null_point_align(mobject2)
+    mobject1.align_submobjects(mobject2)
+    if (
+        isinstance(mobject1, VMobject)
+        and isinstance(mobject2, VMobject)
+        # Subclasses with their own alignment (RiemannRectangles) keep it
+        and type(mobject1).align_points is VMobject.align_points
+        and can_plan(mobject1)
+        and can_plan(mobject2)
+    ):
+        mobject1.align_rgbas(mobject2)
+        if mobject1.get_num_points() != mobject2.get_num_points():
+            pairs.append((mobject1, mobject2))
+    else:
+        mobject1.align_points(mobject2)
+    for sub1, sub2 in zip(mobject1.submobjects, mobject2.submobjects):
+        align_structure(sub1, sub2, pairs)
+
+
+def family_plan(pairs):
+    """Alignment plan of every pair, from the cache when the structure was seen"""
+    ranges = [(subpath_ranges(m1), subpath_ranges(m2)) for m1, m2 in pairs]
+    cache = get_alignment_cache()
+    key = DiskCache.make_key(
+        "alignment",
+        [(len(m1.points), r1, len(m2.points), r2) for (m1, m2), (r1, r2) in zip(pairs, ranges)],
+        manim.__version__,
+    )
+    arrays = _plans.get(key)
+    if arrays is None:
+        arrays = cache.load(key)
+    if arrays is None:
+        plans = [
+            pair_plan(len(m1.points), r1, len(m2.points), r2)
+            for (m1, m2), (r1, r2) in zip(pairs, ranges)
+        ]
+        arrays = {}
+        for side in (0, 1):
+            arrays[f"index{side}"] = np.concatenate(
+                [plan[side][0] for plan in plans] or [np.zeros((0, NPPCC), dtype=int)]
+            )
+            arrays[f"weights{side}"] = np.concatenate(
+                [plan[side][1] for plan in plans] or [np.zeros((0, NPPCC))]
+            )
+            arrays[f"counts{side}"] = np.array([len(plan[side][0]) for plan in plans], dtype=int)
+        cache.store(key, **arrays)
+    _plans[key] = arrays
+    return arrays
+
+
+def apply_plan(arrays, index, weights, counts):
+    """Aligned version of each array (points, vertex colors) with one gather"""
+    sizes = [len(array) for array in arrays]
+    values = np.concatenate(arrays)
+    # Plan indices are relative to each mobject's own points
+    offsets = np.repeat(np.cumsum([0] + sizes[:-1]), counts)
+    aligned = np.einsum("nk,nkd->nd", weights, values[index + offsets[:, None]])
+    return np.split(aligned, np.cumsum(counts)[:-1])
+
+
+def align_data(mobject1, mobject2):
+    """Mobject.align_data with the point alignment done by a cached plan"""
+    families = mobject1.get_family() + mobject2.get_family()
+    colored = any(has_vertex_colors(mob) for mob in families)
+    if colored:
+        # Both sides need vertex colors to be interpolated
+        for mob in families:
+            fit_vertex_colors(mob)
+    pairs = []
+    align_structure(mobject1, mobject2, pairs)
+    if pairs:
+        arrays = family_plan(pairs)
+        for side in (0, 1):
+            mobjects = [pair[side] for pair in pairs]
+            plan = arrays[f"index{side}"], arrays[f"weights{side}"], arrays[f"counts{side}"]
+            if colored:
+                rgbas = apply_plan([mob.vertex_rgbas for mob in mobjects], *plan)
+            points = apply_plan([mob.points for mob in mobjects], *plan)
+            for i, mob in enumerate(mobjects):
+                mob.set_points(points[i])
+                if colored:
+                    mob.vertex_rgbas = rgbas[i]
+    if colored:
+        # Submobjects added by the alignment, and pairs aligned by manim
+        for mob in mobject1.get_family() + mobject2.get_family():
+            fit_vertex_colors(mob)
+
+
+class PlannedTransform(Transform):
+    """Transform whose point alignment is a cached index/weight map.
+
+    Pairing submobjects is done as in manim, but subdividing the curves of
+    every pair is replaced by a plan keyed by the point and subpath counts of
+    both families: computed once, stored on disk, and applied to the whole
+    family in one vectorized gather.
+
+    Vertex colors (vertexcolor.set_color_by_function) are aligned with the
+    same plan and interpolated with the points.
+    """
+
+    def begin(self):
+        self.target_mobject = self.create_target()
+        self.target_copy = self.target_mobject.copy()
+        if config.renderer == RendererType.OPENGL:
+            self.mobject.align_data_and_family(self.target_copy)
+        else:
+            align_data(self.mobject, self.target_copy)
+        Animation.begin(self)
+
+    def interpolate_submobject(self, submobject, starting_submobject, target_copy, alpha):
+        super().interpolate_submobject(submobject, starting_submobject, target_copy, alpha)
+        interpolate_vertex_colors(submobject, starting_submobject, target_copy, alpha)
+        return self
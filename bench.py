@@ -0,0 +1,305 @@
+"""Benchmark every scene of the catalog and compare against a baseline.
+
+Usage:
+    python bench.py                                # manim.cfg settings (4K60)
+    python bench.py --width 1920 --height 1080 --fps 30
+    python bench.py re4lity.py --scene Re4lityFadeIn --repeat 3
+    python bench.py --save-baseline                # record the current numbers
+    python bench.py re4lity.py --scene Re4lityAdvanced --tile-threads 1 2 4 8
+
+Each scene is rendered in a fresh process, one at a time, with manim's
+cache disabled. Results (construct time outside the plays, wall time per
+play, frames/s over the plays, peak RSS, movie size) are written to
+media/bench/results.json and compared with media/bench/baseline.json when
+it was recorded with the same settings.
+With --tile-threads every scene is rendered once per count of band
+painting threads (fastrender.TILE_WORKERS), and the runs are only
+compared with each other.
+"""
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from profiling import dump_from_env, trace_from_env
+from render_all import (
+    ROOT, find_scenes, init_worker, load_scene_class, output_file, scene_kwargs,
+)
+
+CATALOG = ["manimlogo.py", "manimlogo-1.py", "re4lity.py", "reality.py", "reality-extend.py"]
+BENCH_DIR = ROOT / "media" / "bench"
+RESULTS_FILE = BENCH_DIR / "results.json"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+# Relative change reported as a regression
+THRESHOLD = 0.10
+# Metric -> True when higher is better
+METRICS = {
+    "wall_time": False,
+    "construct_time": False,
+    "fps": True,
+    "peak_rss": False,
+    "output_bytes": False,
+}
+
+
+def settings(width=None, height=None, fps=None):
+    """Resolution and frame rate of the run, manim.cfg for what is not given"""
+    from manim import config
+
+    return {
+        "pixel_width": width or config.pixel_width,
+        "pixel_height": height or config.pixel_height,
+        "frame_rate": fps or config.frame_rate,
+    }
+
+
+def instrument(scene):
+    """Time construct() outside its plays and every play/wait, count the frames written"""
+    stats = {"construct_time": 0.0, "play_time": 0.0, "plays": [], "frames": 0}
+    renderer = scene.renderer
+    file_writer = renderer.file_writer
+    construct, play, write_frame = scene.construct, renderer.play, file_writer.write_frame
+
+    def timed_construct():
+        start = time.perf_counter()
+        try:
+            construct()
+        finally:
+            # construct() runs the plays, their time is reported per play
+            stats["play_time"] = sum(play["wall_time"] for play in stats["plays"])
+            stats["construct_time"] = time.perf_counter() - start - stats["play_time"]
+
+    def timed_play(scene, *args, **kwargs):
+        frames = stats["frames"]
+        start = time.perf_counter()
+        play(scene, *args, **kwargs)
+        stats["plays"].append({
+            "animations": [type(arg).__name__ for arg in args],
+            "wall_time": time.perf_counter() - start,
+            "frames": stats["frames"] - frames,
+        })
+
+    def counted_write_frame(frame_or_renderer, num_frames=1):
+        stats["frames"] += num_frames
+        write_frame(frame_or_renderer, num_frames)
+
+    scene.construct = timed_construct
+    renderer.play = timed_play
+    file_writer.write_frame = counted_write_frame
+    return stats
+
+
+def bench_scene(script, scene_name, overrides):
+    """Render one scene in this process and return its measurements"""
+    from manim import tempconfig
+
+    start = time.perf_counter()
+    with tempconfig({
+        "input_file": str(script),
+        "media_dir": str(BENCH_DIR),
+        "disable_caching": True,
+        **overrides,
+    }):
+        scene_class = load_scene_class(script, scene_name)
+        scene = scene_class(**scene_kwargs(scene_class))
+        stats = instrument(scene)
+        tracer = trace_from_env(scene)
+        scene.render()
+    wall_time = time.perf_counter() - start
+    dump_from_env(tracer, scene_name)
+
+    movie = output_file(scene)
+    return {
+        "wall_time": wall_time,
+        **stats,
+        "fps": stats["frames"] / stats["play_time"] if stats["play_time"] else 0.0,
+        # ru_maxrss is in KiB on Linux
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "output_bytes": Path(movie).stat().st_size if movie and Path(movie).exists() else 0,
+    }
+
+
+def run_bench(script, scene_name, overrides):
+    """Pool entry point, errors are reported instead of raised"""
+    try:
+        return bench_scene(script, scene_name, overrides)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def bench_all(jobs, overrides, repeat=1, tile_threads=None):
+    """Benchmark the jobs one after the other, keep the fastest of repeat runs"""
+    results = []
+    for script, scene_name in jobs:
+        runs = []
+        for _ in range(repeat):
+            # A fresh process per run: peak RSS is the scene's own, and
+            # nothing is warm from the previous scene
+            with ProcessPoolExecutor(
+                max_workers=1, initializer=init_worker, initargs=(None, tile_threads),
+            ) as pool:
+                runs.append(pool.submit(run_bench, str(script), scene_name, overrides).result())
+        result = {"script": Path(script).name, "scene": scene_name}
+        if tile_threads:
+            result["tile_threads"] = tile_threads
+        failed = [run for run in runs if "error" in run]
+        if failed:
+            result.update(failed[0])
+            print(f"  FAILED {result['script']}:{scene_name} ({result['error']})")
+        else:
+            result.update(min(runs, key=lambda run: run["wall_time"]))
+            threads = f" ({tile_threads} tile threads)" if tile_threads else ""
+            print(
+                f"  {result['script']}:{scene_name}{threads} {result['wall_time']:.1f}s "
+                f"{result['frames']} frames {result['fps']:.1f} fps "
+                f"{result['peak_rss'] / 1024 ** 2:.0f} MiB"
+            )
+        results.append(result)
+    return results
+
+
+def environment():
+    import manim
+
+    return {"manim": manim.__version__, "python": platform.python_version()}
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Relative change of every metric against the baseline, with regressions flagged"""
+    if baseline["settings"] != results["settings"]:
+        print(f"Baseline settings {baseline['settings']} differ, not compared")
+        return []
+    previous = {
+        (scene["script"], scene["scene"]): scene
+        for scene in baseline["scenes"] if "error" not in scene
+    }
+    changes = []
+    for scene in results["scenes"]:
+        old = previous.get((scene["script"], scene["scene"]))
+        if old is None or "error" in scene:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if not old[metric]:
+                continue
+            change = scene[metric] / old[metric] - 1
+            worse = -change if higher_is_better else change
+            changes.append({
+                "script": scene["script"],
+                "scene": scene["scene"],
+                "metric": metric,
+                "baseline": old[metric],
+                "current": scene[metric],
+                "change": change,
+                "regression": worse > threshold,
+            })
+    return changes
+
+
+def print_changes(changes):
+    for change in changes:
+        flag = "  REGRESSION" if change["regression"] else ""
+        print(
+            f"  {change['script']}:{change['scene']} {change['metric']} "
+            f"{change['change']:+.1%}{flag}"
+        )
+
+
+def print_tile_scaling(scenes):
+    """Speedup of every tile thread count over the first one, per scene"""
+    first = {}
+    for scene in scenes:
+        if "error" in scene:
+            continue
+        key = (scene["script"], scene["scene"])
+        base = first.setdefault(key, scene)
+        print(
+            f"  {scene['script']}:{scene['scene']} {scene['tile_threads']} tile threads "
+            f"x{base['wall_time'] / scene['wall_time']:.2f}"
+        )
+
+
+def write_json(data, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    print(f"Written to {path}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", help=f"scene scripts (default: {', '.join(CATALOG)})")
+    parser.add_argument("--scene", action="append", help="only benchmark these classes")
+    parser.add_argument("--width", type=int, help="pixel width (default: manim.cfg)")
+    parser.add_argument("--height", type=int, help="pixel height (default: manim.cfg)")
+    parser.add_argument("--fps", type=int, help="frame rate (default: manim.cfg)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scene, the fastest is kept")
+    parser.add_argument("--results", default=RESULTS_FILE, help="results JSON path")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON path")
+    parser.add_argument(
+        "--threshold", type=float, default=THRESHOLD,
+        help=f"relative change reported as a regression (default: {THRESHOLD})",
+    )
+    parser.add_argument(
+        "--tile-threads", type=int, nargs="+",
+        help="render every scene with each of these band painting thread counts",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="also write the results as the new baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scripts = [Path(s).resolve() for s in args.scripts] or [ROOT / name for name in CATALOG]
+    jobs = find_scenes(scripts)
+    if args.scene:
+        jobs = [job for job in jobs if job[1] in args.scene]
+    if not jobs:
+        print("No scenes found")
+        return 1
+
+    init_worker(None)
+    overrides = settings(args.width, args.height, args.fps)
+    print(
+        f"Benchmarking {len(jobs)} scenes at {overrides['pixel_width']}x"
+        f"{overrides['pixel_height']} {overrides['frame_rate']}fps"
+    )
+    if args.tile_threads:
+        scenes = [
+            scene
+            for tile_threads in args.tile_threads
+            for scene in bench_all(jobs, overrides, args.repeat, tile_threads)
+        ]
+    else:
+        scenes = bench_all(jobs, overrides, args.repeat)
+    results = {
+        "settings": overrides,
+        "environment": environment(),
+        "scenes": scenes,
+    }
+
+    baseline_path = Path(args.baseline)
+    if args.tile_threads:
+        # A sweep has several runs per scene, the baseline has one
+        print_tile_scaling(scenes)
+    elif baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        results["comparison"] = compare(results, baseline, args.threshold)
+        print_changes(results["comparison"])
+    write_json(results, args.results)
+    if args.save_baseline and not args.tile_threads:
+        write_json({k: v for k, v in results.items() if k != "comparison"}, baseline_path)
+
+    failed = any("error" in scene for scene in results["scenes"])
+    regressed = any(change["regression"] for change in results.get("comparison", []))
+    return 1 if failed or regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
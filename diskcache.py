@@ -0,0 +1,78 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+
+class DiskCache:
+    """Content-addressed directory of .npz entries shared between processes.
+
+    Entries are written atomically, a hit refreshes the file's mtime and the
+    least recently used entries are evicted once the directory grows past
+    max_bytes.
+    """
+
+    suffix = ".npz"
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(*parts):
+        """Stable hash of the parts' reprs, usable across processes"""
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        return self.directory / f"{key}{self.suffix}"
+
+    def load(self, key):
+        """Return the stored arrays, or None on a miss"""
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            os.utime(path)  # LRU: mark as recently used
+        except (OSError, ValueError, zipfile.BadZipFile):
+            # Missing, evicted by another process meanwhile, or truncated
+            return None
+        return arrays
+
+    def store(self, key, **arrays):
+        """Atomically write the arrays under key, then enforce the size cap"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self, keep=()):
+        """Remove least recently used entries until the cap is respected"""
+        keep = {Path(path) for path in keep}
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path in keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,143 @@
+"""Proxy renders while iterating on a scene, full resolution only for what changed.
+
+Usage:
+    python draft.py re4lity.py Re4lityFadeIn            # 960x540 15fps proxy
+    python draft.py re4lity.py Re4lityFadeIn --final    # 4K60 pass from manim.cfg
+
+Every render records the hash of each play/wait segment (manim's partial
+movie hash) in media/drafts/<script>/<Scene>.json. The draft lists the
+segments that changed since the last final render; the final pass keeps
+manim's partial movie cache, so unchanged segments are reused from the
+previous 4K render and only the changed ones are rasterized.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from render_all import ROOT, init_worker, output_file, render_scene
+
+DRAFT_DIR = ROOT / "media" / "drafts"
+DRAFT_SCALE = 0.25
+DRAFT_FPS = 15
+# Enough partial movies to keep every segment of every scene cached
+MAX_FILES_CACHED = 1000
+
+
+def draft_overrides(scale=DRAFT_SCALE, fps=DRAFT_FPS):
+    """Config overrides of a proxy render, same frame (and timeline) as the final"""
+    from manim import config
+
+    return {
+        # Even sizes, the encoder rejects odd ones
+        "pixel_width": max(2, int(config.pixel_width * scale) // 2 * 2),
+        "pixel_height": max(2, int(config.pixel_height * scale) // 2 * 2),
+        "frame_rate": fps,
+        "max_files_cached": MAX_FILES_CACHED,
+    }
+
+
+def final_overrides():
+    return {"max_files_cached": MAX_FILES_CACHED}
+
+
+def manifest_path(script, scene_name):
+    return DRAFT_DIR / Path(script).stem / f"{scene_name}.json"
+
+
+def load_manifest(path):
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"settings": None, "draft": None, "final": None}
+
+
+def save_manifest(path, manifest):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def segment_hashes(scene):
+    """Hash of every play/wait segment, in order"""
+    return list(scene.renderer.animations_hashes)
+
+
+def changed_segments(old, new):
+    """Indices of the segments of new that are not in old at the same position"""
+    if old is None:
+        return list(range(len(new)))
+    return [
+        i for i, segment in enumerate(new)
+        if i >= len(old) or old[i] != segment
+    ]
+
+
+def describe_changes(changed, total):
+    if not changed:
+        return f"no segment changed ({total} segments)"
+    return f"{len(changed)}/{total} segments changed: {', '.join(map(str, changed))}"
+
+
+def draft(script, scene_name, scale=DRAFT_SCALE, fps=DRAFT_FPS, dry_run=False):
+    """Proxy render, records the segment hashes and returns the manifest"""
+    path = manifest_path(script, scene_name)
+    manifest = load_manifest(path)
+    overrides = draft_overrides(scale, fps)
+    settings = [overrides["pixel_width"], overrides["pixel_height"], fps]
+    if manifest.get("settings") != settings:
+        # Hashes include the camera, other proxy settings can't be compared
+        manifest = {"settings": settings, "draft": None, "final": None}
+
+    scene, wall_time = render_scene(
+        script, scene_name, {**overrides, "dry_run": dry_run},
+    )
+    hashes = segment_hashes(scene)
+    if not dry_run:
+        print(f"Draft {scene_name} {wall_time:.1f}s -> {output_file(scene)}")
+    print("Since the last final render, " + describe_changes(
+        changed_segments(manifest["final"], hashes), len(hashes),
+    ))
+    manifest["draft"] = hashes
+    save_manifest(path, manifest)
+    return manifest
+
+
+def final(script, scene_name, scale=DRAFT_SCALE, fps=DRAFT_FPS):
+    """Full resolution render, unchanged segments come from manim's cache"""
+    # Hash the current timeline at proxy size without writing anything, so
+    # the final is recorded against what is actually rendered
+    manifest = draft(script, scene_name, scale, fps, dry_run=True)
+    scene, wall_time = render_scene(script, scene_name, final_overrides())
+    print(f"Final {scene_name} {wall_time:.1f}s -> {output_file(scene)}")
+    manifest["final"] = manifest["draft"]
+    save_manifest(manifest_path(script, scene_name), manifest)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script", help="scene script")
+    parser.add_argument("scene", help="scene class")
+    parser.add_argument("--final", action="store_true", help="full resolution pass")
+    parser.add_argument(
+        "--scale", type=float, default=DRAFT_SCALE,
+        help=f"draft resolution relative to manim.cfg (default: {DRAFT_SCALE})",
+    )
+    parser.add_argument(
+        "--fps", type=int, default=DRAFT_FPS,
+        help=f"draft frame rate (default: {DRAFT_FPS})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    script = Path(args.script).resolve()
+    init_worker(None)
+    if args.final:
+        final(script, args.scene, args.scale, args.fps)
+    else:
+        draft(script, args.scene, args.scale, args.fps)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,647 @@
+import itertools as it
+import os
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import cairo
+from manim import *
+from manim.camera.camera import CAP_STYLE_MAP, LINE_JOIN_MAP, Camera
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.file_ops import is_gif_format
+from manim.utils.iterables import list_update, stretch_array_to_length
+
+from glow import GlowText
+from riemann import POINTS_PER_RECT, RiemannRectangles
+from vertexcolor import has_vertex_colors
+from writers import GifFileWriter, SegmentCacheWriter
+
+# Frames of at least this many pixels are rasterized in horizontal bands
+TILE_MIN_PIXELS = 1920 * 1080
+# Rows of the thinnest band
+TILE_MIN_ROWS = 64
+# Threads painting the bands, render_all lowers it for its worker processes
+TILE_WORKERS = os.cpu_count() or 1
+# A miter join reaches at most 5 stroke widths out (cairo's miter limit is 10)
+MITER_REACH = 5
+# cairo paths kept per camera, by points and context matrix (bands share them)
+PATH_CACHE_SIZE = 4096
+
+_tile_pool = None
+
+
+def get_tile_pool():
+    """The process-wide pool of band painting threads"""
+    global _tile_pool
+    if _tile_pool is None:
+        _tile_pool = ThreadPoolExecutor(TILE_WORKERS, thread_name_prefix="tile")
+    return _tile_pool
+
+
+def has_layers(vmobject):
+    return getattr(vmobject, "layer_kinds", None) is not None
+
+
+def has_radii(pmobject):
+    return getattr(pmobject, "radii", None) is not None
+
+
+def fingerprint(mobjects):
+    """Hash of the arrays and scalars the camera reads, changes on any mutation"""
+    parts = []
+    for mobject in mobjects:
+        parts.append(id(mobject))
+        for key, value in vars(mobject).items():
+            if isinstance(value, np.ndarray):
+                parts.append(value.tobytes())
+            elif isinstance(value, list) and value and isinstance(value[0], np.ndarray):
+                parts.extend(array.tobytes() for array in value)
+            elif value is None or isinstance(value, (bool, int, float, str)):
+                parts.append((key, value))
+    return hash(tuple(parts))
+
+
+class FastCamera(Camera):
+    """Cairo camera that knows about the array-backed mobjects of this repo.
+
+    Large frames are rasterized in horizontal bands on a thread pool. Each
+    band draws, into its own rows of the pixel array, only the VMobjects
+    whose bounding box reaches it; cairo releases the GIL while it fills and
+    strokes, and coverage doesn't depend on the band, so the frame is the
+    same as when drawn in one go.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.path_cache = OrderedDict()
+        self.path_lock = Lock()
+
+    def set_cairo_context_path(self, ctx, vmobject):
+        """Camera.set_cairo_context_path, replayed from the cache when the same
+        points were drawn with the same matrix, as in style-only animations
+        """
+        points = vmobject.points
+        if not len(points):
+            return None
+        matrix = ctx.get_matrix()
+        # cairo keeps paths in fixed point device coordinates, which a whole
+        # pixel translation leaves exact: the bands of a frame (the same
+        # matrix, whole rows apart) share their paths
+        key = (
+            type(vmobject), points.shape, hash(points.tobytes()),
+            matrix.xx, matrix.yy, matrix.x0 % 1, matrix.y0 % 1,
+        )
+        with self.path_lock:
+            path = self.path_cache.get(key)
+            if path is not None:
+                self.path_cache.move_to_end(key)
+        if path is not None:
+            ctx.new_path()
+            ctx.append_path(path)
+            return self
+        super().set_cairo_context_path(ctx, vmobject)
+        path = ctx.copy_path()
+        with self.path_lock:
+            self.path_cache[key] = path
+            if len(self.path_cache) > PATH_CACHE_SIZE:
+                self.path_cache.popitem(last=False)
+        return self
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        # manim passes a batch of itertools.groupby
+        vmobjects = list(vmobjects)
+        ctx = self.get_cairo_context(pixel_array)
+        bands = self.tile_bands(vmobjects, pixel_array)
+        if bands is None:
+            return self.draw_vmobjects(vmobjects, ctx)
+        # Paths are built in Python under the GIL: build those of the
+        # vmobjects spanning several bands once, the bands replay them
+        band_counts = Counter(id(vmobject) for *_, members in bands for vmobject in members)
+        for vmobject in vmobjects:
+            if band_counts[id(vmobject)] > 1:
+                self.set_cairo_context_path(ctx, vmobject)
+        ctx.new_path()
+        matrix = ctx.get_matrix()
+        list(get_tile_pool().map(
+            lambda band: self.draw_band(matrix, pixel_array, *band), bands,
+        ))
+        return self
+
+    def tile_bands(self, vmobjects, pixel_array):
+        """(first row, end row, vmobjects) of each band with something to draw,
+        None for a frame too small to split
+        """
+        height, width = pixel_array.shape[:2]
+        num_bands = min(TILE_WORKERS, height // TILE_MIN_ROWS)
+        if height * width < TILE_MIN_PIXELS or num_bands < 2:
+            return None
+        edges = np.linspace(0, height, num_bands + 1).astype(int)
+        extents = self.row_extents(vmobjects)
+        hits = (extents[:, :1] < edges[None, 1:]) & (extents[:, 1:] > edges[None, :-1])
+        bands = []
+        for index in range(num_bands):
+            members = np.flatnonzero(hits[:, index])
+            if len(members):
+                bands.append((edges[index], edges[index + 1], [vmobjects[i] for i in members]))
+        return bands
+
+    def row_extents(self, vmobjects):
+        """Rows (top, bottom) each VMobject can paint, strokes and joins included"""
+        scale = self.pixel_height / self.frame_height
+        center_row = self.pixel_height / 2 + self.frame_center[1] * scale
+        extents = np.tile([np.inf, -np.inf], (len(vmobjects), 1))
+        for index, vmobject in enumerate(vmobjects):
+            points = self.transform_points_pre_display(vmobject, vmobject.points)
+            if not len(points):
+                continue
+            widths = [
+                vmobject.get_stroke_width(),
+                vmobject.get_stroke_width(background=True),
+                *np.ravel(getattr(vmobject, "layer_widths", [])),
+            ]
+            reach = MITER_REACH * max(widths) * self.cairo_line_width_multiple * scale + 2
+            ys = points[:, 1]
+            extents[index] = (
+                center_row - ys.max() * scale - reach,
+                center_row - ys.min() * scale + reach,
+            )
+        return extents
+
+    def draw_band(self, matrix, pixel_array, start, end, vmobjects):
+        """Draw the vmobjects into the rows [start, end), without copying them"""
+        rows = pixel_array[start:end]
+        surface = cairo.ImageSurface.create_for_data(
+            rows, cairo.FORMAT_ARGB32, rows.shape[1], end - start,
+        )
+        ctx = cairo.Context(surface)
+        ctx.set_matrix(cairo.Matrix(
+            matrix.xx, matrix.yx, matrix.xy, matrix.yy, matrix.x0, matrix.y0 - start,
+        ))
+        self.draw_vmobjects(vmobjects, ctx)
+        surface.finish()
+
+    def draw_vmobjects(self, vmobjects, ctx):
+        for layered, batch in it.groupby(vmobjects, has_layers):
+            if layered:
+                self.display_layers(list(batch), ctx)
+            else:
+                for vmobject in batch:
+                    self.display_vectorized(vmobject, ctx)
+        return self
+
+    def display_layers(self, glyphs, ctx):
+        """Paint GlowGlyphs layer by layer, building each cairo path only once.
+
+        Painting layer-major keeps the look of stacked text copies, where
+        every glow is below every fill.
+        """
+        paths = []
+        for glyph in glyphs:
+            if self.set_cairo_context_path(ctx, glyph) is None:
+                paths.append(None)
+            else:
+                paths.append(ctx.copy_path())
+
+        n_layers = max(len(glyph.layer_kinds) for glyph in glyphs)
+        for index in range(n_layers):
+            for glyph, path in zip(glyphs, paths):
+                if path is None or index >= len(glyph.layer_kinds):
+                    continue
+                rgbas = glyph.layer_rgbas[index]
+                width = glyph.layer_widths[index]
+                kind = glyph.layer_kinds[index]
+                if not rgbas[:, 3].any() or (kind == "stroke" and width <= 0):
+                    continue
+                ctx.new_path()
+                ctx.append_path(path)
+                if kind == "fill":
+                    self.set_cairo_context_color(ctx, rgbas, glyph)
+                    ctx.fill_preserve()
+                else:
+                    self.stroke_layer(ctx, glyph, rgbas, width)
+        return self
+
+    def stroke_layer(self, ctx, vmobject, rgbas, width):
+        """Same as apply_stroke, with the color and width of one layer"""
+        self.set_cairo_context_color(ctx, rgbas, vmobject)
+        ctx.set_line_width(width * self.cairo_line_width_multiple)
+        if vmobject.joint_type != LineJointType.AUTO:
+            ctx.set_line_join(LINE_JOIN_MAP[vmobject.joint_type])
+        if vmobject.cap_style != CapStyleType.AUTO:
+            ctx.set_line_cap(CAP_STYLE_MAP[vmobject.cap_style])
+        ctx.stroke_preserve()
+
+    def apply_fill(self, ctx, vmobject):
+        if isinstance(vmobject, RiemannRectangles):
+            return self.paint_rects(ctx, vmobject, self.get_fill_rgbas(vmobject), ctx.fill)
+        if not has_vertex_colors(vmobject):
+            return super().apply_fill(ctx, vmobject)
+        opacity = self.get_fill_rgbas(vmobject)[:, 3].max()
+        if opacity > 0:
+            ctx.set_source(self.vertex_color_mesh(vmobject, opacity))
+            ctx.fill_preserve()
+        return self
+
+    def apply_stroke(self, ctx, vmobject, background=False):
+        if isinstance(vmobject, RiemannRectangles) and not background:
+            width = vmobject.get_stroke_width()
+            if width == 0:
+                return self
+            ctx.save()
+            ctx.set_line_width(width * self.cairo_line_width_multiple)
+            if vmobject.joint_type != LineJointType.AUTO:
+                ctx.set_line_join(LINE_JOIN_MAP[vmobject.joint_type])
+            if vmobject.cap_style != CapStyleType.AUTO:
+                ctx.set_line_cap(CAP_STYLE_MAP[vmobject.cap_style])
+            self.paint_rects(ctx, vmobject, self.get_stroke_rgbas(vmobject), ctx.stroke)
+            ctx.restore()
+            return self
+        if background or not has_vertex_colors(vmobject):
+            return super().apply_stroke(ctx, vmobject, background)
+        width = vmobject.get_stroke_width()
+        opacity = self.get_stroke_rgbas(vmobject)[:, 3].max()
+        if width == 0 or opacity == 0:
+            return self
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        rgbas = self.vertex_colors(vmobject, opacity)
+        path = ctx.copy_path()
+        ctx.save()
+        ctx.set_line_width(width * self.cairo_line_width_multiple)
+        if vmobject.joint_type != LineJointType.AUTO:
+            ctx.set_line_join(LINE_JOIN_MAP[vmobject.joint_type])
+        # Curves are stroked one by one, round caps close the joints
+        ctx.set_line_cap(cairo.LINE_CAP_ROUND)
+        for curve, rgba0, rgba1 in zip(points.reshape(-1, 4, 3), rgbas[0::4], rgbas[3::4]):
+            if np.allclose(curve, curve[0]):
+                continue
+            ctx.new_path()
+            ctx.move_to(*curve[0, :2])
+            ctx.curve_to(*curve[1, :2], *curve[2, :2], *curve[3, :2])
+            gradient = cairo.LinearGradient(*curve[0, :2], *curve[3, :2])
+            gradient.add_color_stop_rgba(0, *rgba0[2::-1], rgba0[3])
+            gradient.add_color_stop_rgba(1, *rgba1[2::-1], rgba1[3])
+            ctx.set_source(gradient)
+            ctx.stroke()
+        ctx.restore()
+        ctx.new_path()
+        ctx.append_path(path)
+        return self
+
+    def paint_rects(self, ctx, vmobject, rgbas, paint):
+        """Fill or stroke each rectangle of a RiemannRectangles with its own flat color.
+
+        Its rgbas hold one row per rectangle; given to cairo as they are
+        they would be the stops of a single gradient across all of them.
+        """
+        n = len(vmobject.points) // POINTS_PER_RECT
+        if n == 0:
+            return self
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        # The corners are the first point of each edge
+        corners = points[: n * POINTS_PER_RECT].reshape(n, 4, 4, 3)[:, :, 0, :2]
+        path = ctx.copy_path()
+        for rect, rgba in zip(corners, stretch_array_to_length(rgbas, n)):
+            if rgba[3] == 0:
+                continue
+            ctx.new_path()
+            ctx.move_to(*rect[0])
+            for corner in rect[1:]:
+                ctx.line_to(*corner)
+            ctx.close_path()
+            ctx.set_source_rgba(*rgba[2::-1], rgba[3])
+            paint()
+        ctx.new_path()
+        ctx.append_path(path)
+        return self
+
+    def vertex_colors(self, vmobject, opacity):
+        rgbas = vmobject.vertex_rgbas.copy()
+        rgbas[:, 3] *= opacity
+        return rgbas
+
+    def vertex_color_mesh(self, vmobject, opacity):
+        """Mesh pattern with the vertex colors, one patch per curve or facet.
+
+        A subpath of 4 curves (a facet, as in ShadedSphere) is one patch with
+        a color per corner. Any other subpath is a fan of patches from its
+        center, whose color is the mean of its anchors.
+        """
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        curves = points.reshape(-1, 4, 3)
+        rgbas = self.vertex_colors(vmobject, opacity)
+        anchor_rgbas = np.stack([rgbas[0::4], rgbas[3::4]], axis=1)
+        # A subpath starts where a curve doesn't begin at the previous end
+        breaks = ~np.isclose(curves[1:, 0, :2], curves[:-1, 3, :2]).all(axis=1)
+        bounds = np.concatenate([[0], np.flatnonzero(breaks) + 1, [len(curves)]])
+
+        mesh = cairo.MeshPattern()
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if end - start == 4:
+                mesh.begin_patch()
+                mesh.move_to(*curves[start, 0, :2])
+                for corner, curve in enumerate(curves[start:end]):
+                    mesh.curve_to(*curve[1, :2], *curve[2, :2], *curve[3, :2])
+                    rgba = anchor_rgbas[start + corner, 0]
+                    mesh.set_corner_color_rgba(corner, *rgba[2::-1], rgba[3])
+                mesh.end_patch()
+                continue
+            center = curves[start:end, 0].mean(axis=0)
+            center_rgba = anchor_rgbas[start:end].mean(axis=(0, 1))
+            for curve, (rgba0, rgba1) in zip(curves[start:end], anchor_rgbas[start:end]):
+                mesh.begin_patch()
+                mesh.move_to(*center[:2])
+                mesh.line_to(*curve[0, :2])
+                mesh.curve_to(*curve[1, :2], *curve[2, :2], *curve[3, :2])
+                mesh.line_to(*center[:2])
+                for corner, rgba in enumerate((center_rgba, rgba0, rgba1, center_rgba)):
+                    mesh.set_corner_color_rgba(corner, *rgba[2::-1], rgba[3])
+                mesh.end_patch()
+        return mesh
+
+    def display_multiple_point_cloud_mobjects(self, pmobjects, pixel_array):
+        for round_particles, batch in it.groupby(pmobjects, has_radii):
+            if round_particles:
+                ctx = self.get_cairo_context(pixel_array)
+                for particles in batch:
+                    self.display_particles(particles, ctx)
+            else:
+                super().display_multiple_point_cloud_mobjects(list(batch), pixel_array)
+
+    def display_particles(self, particles, ctx):
+        """Draw Particles as discs, with one cairo fill per distinct color"""
+        visible = particles.rgbas[:, 3] > 0
+        if not visible.any():
+            return self
+        points = self.transform_points_pre_display(particles, particles.points[visible])
+        radii = particles.radii[visible]
+        colors, color_index = np.unique(particles.rgbas[visible], axis=0, return_inverse=True)
+        for index, rgba in enumerate(colors):
+            ctx.new_path()
+            selected = color_index.ravel() == index
+            for (x, y, _), radius in zip(points[selected], radii[selected]):
+                ctx.new_sub_path()
+                ctx.arc(x, y, radius, 0, TAU)
+            ctx.set_source_rgba(*rgba[2::-1], rgba[3])
+            ctx.fill()
+        return self
+
+
+class FastRenderer(CairoRenderer):
+    """CairoRenderer that keeps still mobjects out of the per-frame work.
+
+    manim treats everything above the first moving mobject as moving. Here
+    the mobjects of each play are split in z-order runs of moving and still
+    ones: the still runs are rasterized once into layers, composited between
+    the moving runs at every frame, and reused by later plays as long as
+    their fingerprint (points, colors, widths...) doesn't change. A still
+    mobject changed by an updater of another mobject is not detected.
+
+    Frames where the moving mobjects didn't change are not rasterized again,
+    new frames are copied into the file writer's ring of buffers.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.runs = None
+        self.layers = {}
+        self.last_frame = None
+        self.last_frame_key = None
+
+    def get_moving_ids(self, scene):
+        moving = set()
+        for animation in scene.animations:
+            moving.update(map(id, animation.mobject.get_family()))
+        for mobject in scene.get_mobject_family_members():
+            if mobject.updaters or mobject in scene.foreground_mobjects:
+                moving.update(map(id, mobject.get_family()))
+        # The glyphs of a GlowText are painted layer by layer in one batch:
+        # a still glyph in another run would have its fill under the glow
+        # of the moving one
+        for mobject in scene.get_mobject_family_members():
+            if isinstance(mobject, GlowText) and not moving.isdisjoint(map(id, mobject)):
+                moving.update(map(id, mobject.get_family()))
+        return moving
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.runs = None
+        self.release_last_frame()
+        if not scene.moving_mobjects or not static_mobjects:
+            return super().save_static_frame_data(scene, static_mobjects)
+
+        mobjects = extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            use_z_index=self.camera.use_z_index,
+            only_those_with_points=True,
+        )
+        moving = self.get_moving_ids(scene)
+        runs = [
+            (is_moving, list(batch))
+            for is_moving, batch in it.groupby(mobjects, lambda m: id(m) in moving)
+        ]
+        camera_key = (
+            str(self.camera.background_color),
+            self.camera.background_opacity,
+            self.camera.pixel_array.shape,
+        )
+        layers = {}
+        self.static_image = None
+        self.runs = []
+        for index, (is_moving, batch) in enumerate(runs):
+            if is_moving:
+                self.runs.append((True, batch))
+                continue
+            key = (index == 0, camera_key, fingerprint(batch))
+            layer = self.layers.get(key)
+            if layer is None:
+                layer = self.rasterize_layer(batch, background=index == 0)
+            layers[key] = layer
+            if index == 0:
+                self.static_image = layer
+            elif layer is not None:
+                self.runs.append((False, layer))
+        # Only the layers of this play are kept, a mutated mobject gets a
+        # new fingerprint and its old layer is dropped here
+        self.layers = layers
+        return self.static_image
+
+    def rasterize_layer(self, mobjects, background):
+        """Frame with the mobjects on the background, or (surface, bbox) of
+        the mobjects on a transparent layer, None when the layer is empty
+        """
+        camera = self.camera
+        if background:
+            camera.reset()
+            camera.capture_mobjects(mobjects, include_submobjects=False)
+            return self.get_frame()
+
+        frame = camera.pixel_array
+        camera.pixel_array = np.zeros_like(frame)
+        try:
+            camera.capture_mobjects(mobjects, include_submobjects=False)
+            pixels = camera.pixel_array
+            ctx = camera.pixel_array_to_cairo_context.pop(id(pixels), None)
+        finally:
+            camera.pixel_array = frame
+        rows = np.flatnonzero(pixels[:, :, 3].any(axis=1))
+        cols = np.flatnonzero(pixels[:, :, 3].any(axis=0))
+        if not len(rows):
+            return None
+        if ctx is None:
+            # Only point clouds or images, drawn into the array without cairo
+            height, width = pixels.shape[:2]
+            surface = cairo.ImageSurface.create_for_data(
+                pixels.data, cairo.FORMAT_ARGB32, width, height,
+            )
+        else:
+            surface = ctx.get_target()
+        bbox = (cols[0], rows[0], cols[-1] + 1 - cols[0], rows[-1] + 1 - rows[0])
+        return surface, bbox
+
+    def composite_layer(self, layer):
+        surface, bbox = layer
+        ctx = self.camera.get_cairo_context(self.camera.pixel_array)
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.rectangle(*bbox)
+        ctx.clip()
+        ctx.set_source_surface(surface, 0, 0)
+        ctx.paint()
+        ctx.restore()
+
+    def render(self, scene, time, moving_mobjects):
+        """Render a frame, or hold the last one when nothing moved since.
+
+        The held frame is the same array, writers.HeldFrameWriter converts
+        it for the encoder only once.
+        """
+        key = fingerprint(extract_mobject_family_members(moving_mobjects))
+        if self.last_frame is None or key != self.last_frame_key:
+            self.update_frame(scene, moving_mobjects)
+            self.release_last_frame()
+            self.last_frame = self.ring_frame()
+            self.last_frame_key = key
+        self.add_frame(self.last_frame)
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        self.release_last_frame()
+        self.last_frame = self.ring_frame()
+        self.add_frame(self.last_frame, num_frames=int(duration / dt))
+
+    def ring_frame(self):
+        """The current frame, copied into a buffer of the file writer's
+        writers.FrameRing instead of a new array when it has one.
+
+        Waits for the writer thread when every buffer is still queued.
+        """
+        ring = getattr(self.file_writer, "frame_ring", None)
+        if ring is None:
+            return self.get_frame()
+        pixels = self.camera.pixel_array
+        frame = ring.acquire(pixels.shape, pixels.dtype)
+        np.copyto(frame, pixels)
+        return frame
+
+    def release_last_frame(self):
+        ring = getattr(self.file_writer, "frame_ring", None)
+        if ring is not None:
+            ring.release(self.last_frame)
+        self.last_frame = None
+        self.last_frame_key = None
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        if self.runs is None or mobjects is not scene.moving_mobjects:
+            return super().update_frame(
+                scene, mobjects, include_submobjects, ignore_skipping, **kwargs,
+            )
+        if self.skip_animations and not ignore_skipping:
+            return
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        for is_moving, run in self.runs:
+            if is_moving:
+                self.camera.capture_mobjects(run, include_submobjects=False)
+            else:
+                self.composite_layer(run)
+
+
+class ShardRenderer(FastRenderer):
+    """CairoRenderer that only rasterizes and writes the frames [start, end).
+
+    Animations and updaters still run for every frame, so the scene state at
+    the first frame of the shard is the same as in a full render.
+    """
+
+    def __init__(self, shard=(0, None), **kwargs):
+        super().__init__(**kwargs)
+        self.start_frame, self.end_frame = shard
+        self.frame_index = 0
+        self.play_in_shard = True
+
+    def frames_in_shard(self, num_frames):
+        """How many of the next num_frames frames belong to the shard"""
+        end = self.frame_index + num_frames
+        if self.end_frame is not None:
+            end = min(end, self.end_frame)
+        return max(0, end - max(self.frame_index, self.start_frame))
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        dt = 1 / self.camera.frame_rate
+        # Upper bound of the frames of this play, frozen or not
+        num_frames = max(
+            int(scene.duration / dt), len(np.arange(0, scene.duration, dt)),
+        )
+        self.play_in_shard = self.frames_in_shard(num_frames) > 0
+        if not self.play_in_shard:
+            self.static_image = None
+            return None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def update_frame(self, scene, *args, **kwargs):
+        if self.play_in_shard:
+            super().update_frame(scene, *args, **kwargs)
+
+    def render(self, scene, time, moving_mobjects):
+        if self.frames_in_shard(1):
+            super().render(scene, time, moving_mobjects)
+        else:
+            self.add_frame(None)
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)
+        frame = self.get_frame() if self.frames_in_shard(num_frames) else None
+        self.add_frame(frame, num_frames=num_frames)
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            return
+        written = self.frames_in_shard(num_frames)
+        if written:
+            self.file_writer.write_frame(frame, num_frames=written)
+        self.frame_index += num_frames
+        self.time += num_frames / self.camera.frame_rate
+
+
+class FastScene(Scene):
+    """Scene rendered by FastRenderer with FastCamera, segments cached by SegmentCacheWriter
+
+    GIFs (-i, --format=gif) are written by GifFileWriter instead.
+    """
+
+    default_camera_class = FastCamera
+    file_writer_class = SegmentCacheWriter
+    renderer_class = FastRenderer
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("camera_class", self.default_camera_class)
+        if config.renderer == RendererType.CAIRO and "renderer" not in kwargs:
+            kwargs["renderer"] = self.renderer_class(
+                file_writer_class=GifFileWriter if is_gif_format() else self.file_writer_class,
+                camera_class=kwargs["camera_class"],
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(**kwargs)
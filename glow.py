@@ -0,0 +1,102 @@
+from manim import *
+from manim.utils.iterables import stretch_array_to_length
+import numpy as np
+
+from styleanim import StyleAnimateMixin
+
+
+def stroke_layer(color, width, opacity=1.0):
+    """A stroke drawn around the glyph outline"""
+    return {"kind": "stroke", "color": color, "width": width, "opacity": opacity}
+
+
+def fill_layer(color, opacity=1.0):
+    """A fill of the glyph, color may be a list for a gradient"""
+    return {"kind": "fill", "color": color, "width": 0, "opacity": opacity}
+
+
+def layer_rgbas(color, opacity):
+    colors = color if isinstance(color, (list, tuple)) else [color]
+    rgbas = np.array([color_to_rgba(c) for c in colors])
+    rgbas[:, 3] = opacity
+    return rgbas
+
+
+class GlowGlyph(StyleAnimateMixin, VMobject):
+    """One glyph outline with a stack of stroke/fill layers.
+
+    The layers share the glyph's points, FastCamera builds the cairo path
+    once and paints the layers on it, first layer at the bottom. Animating
+    only the layers (`.animate.set_layer(...)`) doesn't touch the points.
+    """
+
+    def __init__(self, points, layers, stroke_width=0, **kwargs):
+        # The glyph's own style is unused, layers replace it
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.set_points(points)
+        self.layer_kinds = tuple(layer["kind"] for layer in layers)
+        self.layer_widths = np.array([layer["width"] for layer in layers], dtype=float)
+        self.layer_rgbas = [
+            layer_rgbas(layer["color"], layer["opacity"]) for layer in layers
+        ]
+
+    def set_layer(self, index, color=None, width=None, opacity=None):
+        """Change the style of one layer, animatable through .animate"""
+        if color is not None:
+            if opacity is None:
+                opacity = self.layer_rgbas[index][0, 3]
+            self.layer_rgbas[index] = layer_rgbas(color, opacity)
+        elif opacity is not None:
+            self.layer_rgbas[index][:, 3] = opacity
+        if width is not None:
+            self.layer_widths[index] = width
+        return self
+
+    def get_layer_opacity(self, index):
+        return self.layer_rgbas[index][0, 3]
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        super().interpolate_color(mobject1, mobject2, alpha)
+        if not isinstance(mobject1, GlowGlyph) or not isinstance(mobject2, GlowGlyph):
+            return
+        self.layer_widths = interpolate(
+            mobject1.layer_widths, mobject2.layer_widths, alpha
+        )
+        layers = []
+        for rgbas1, rgbas2 in zip(mobject1.layer_rgbas, mobject2.layer_rgbas):
+            n = max(len(rgbas1), len(rgbas2))
+            layers.append(interpolate(
+                stretch_array_to_length(rgbas1, n),
+                stretch_array_to_length(rgbas2, n),
+                alpha,
+            ))
+        self.layer_rgbas = layers
+
+
+class GlowText(StyleAnimateMixin, VGroup):
+    """Text drawn as several stroke/fill layers over shared glyph geometry.
+
+    Replaces stacking copies of the same Text, each glyph keeps one point
+    array and a list of layers, e.g.
+
+        GlowText(text, [
+            stroke_layer(light_purple, 15, opacity=0),
+            stroke_layer(neon_purple, 3, opacity=0),
+            fill_layer([electric_purple, neon_purple], opacity=0),
+        ])
+
+    Needs a scene using FastCamera (see fastrender.FastScene). While any
+    glyph animates, FastRenderer redraws all of them every frame so that
+    every glow stays below every fill.
+    """
+
+    def __init__(self, text, layers, **kwargs):
+        super().__init__(
+            *[GlowGlyph(glyph.points, layers) for glyph in text.family_members_with_points()],
+            **kwargs,
+        )
+
+    def set_layer(self, index, color=None, width=None, opacity=None):
+        for glyph in self:
+            glyph.set_layer(index, color=color, width=width, opacity=opacity)
+        return self
@@ -0,0 +1,158 @@
+import re
+from collections import OrderedDict
+from pathlib import Path
+
+import manim
+from manim import *
+import numpy as np
+
+from diskcache import DiskCache
+
+GLYPH_CACHE_BYTES = 256 * 1024 ** 2
+# Built MarkupTexts kept per process, copied for each new card
+MARKUP_TEMPLATES = 256
+
+_glyph_cache = None
+_markup_templates = OrderedDict()
+
+
+def get_glyph_cache():
+    """The process-wide glyph cache, stored next to manim's own text cache"""
+    global _glyph_cache
+    if _glyph_cache is None:
+        _glyph_cache = DiskCache(Path(config.media_dir) / "glyphs", GLYPH_CACHE_BYTES)
+    return _glyph_cache
+
+
+def glyphs_to_arrays(glyphs):
+    """Pack glyph outlines and their SVG style into flat arrays"""
+    glyphs = list(glyphs)
+    return {
+        "points": np.vstack([g.points for g in glyphs] or [np.zeros((0, 3))]),
+        "point_counts": np.array([len(g.points) for g in glyphs], dtype=int),
+        "fill_rgbas": np.vstack([g.fill_rgbas for g in glyphs] or [np.zeros((0, 4))]),
+        "fill_counts": np.array([len(g.fill_rgbas) for g in glyphs], dtype=int),
+        "stroke_rgbas": np.vstack([g.stroke_rgbas for g in glyphs] or [np.zeros((0, 4))]),
+        "stroke_counts": np.array([len(g.stroke_rgbas) for g in glyphs], dtype=int),
+        "stroke_widths": np.array([g.stroke_width for g in glyphs], dtype=float),
+    }
+
+
+def glyphs_from_arrays(arrays):
+    """Rebuild the glyph VMobjects packed by glyphs_to_arrays"""
+    def split(name, counts_name):
+        return np.split(arrays[name], np.cumsum(arrays[counts_name])[:-1])
+
+    glyphs = []
+    for points, fill, stroke, width in zip(
+        split("points", "point_counts"),
+        split("fill_rgbas", "fill_counts"),
+        split("stroke_rgbas", "stroke_counts"),
+        arrays["stroke_widths"],
+    ):
+        glyph = VMobject()
+        glyph.set_points(points)
+        glyph.fill_rgbas = fill
+        glyph.stroke_rgbas = stroke
+        glyph.stroke_width = float(width)
+        glyphs.append(glyph)
+    return glyphs
+
+
+class GlyphCacheMixin:
+    """Load outlines from the persistent glyph cache instead of parsing the SVG.
+
+    The SVG file name is manim's hash of the text and every style setting
+    (font, weight, slant, size, markup, colors, line spacing), so it is used
+    as the content address together with the parsing options.
+    """
+
+    def glyph_key(self):
+        return DiskCache.make_key(
+            type(self).__name__,
+            self.file_name.stem,
+            sorted(self.svg_default.items()),
+            sorted(self.path_string_config.items()),
+            manim.__version__,
+        )
+
+    def generate_mobject(self):
+        cache = get_glyph_cache()
+        key = self.glyph_key()
+        arrays = cache.load(key)
+        if arrays is not None:
+            # Stored after the y flip done by SVGMobject, so add them as is
+            self.add(*glyphs_from_arrays(arrays))
+            return
+        super().generate_mobject()
+        cache.store(key, **glyphs_to_arrays(self.submobjects))
+
+
+class CachedText(GlyphCacheMixin, Text):
+    """Text whose glyph outlines survive between renders and workers"""
+
+
+class CachedMarkupText(GlyphCacheMixin, MarkupText):
+    """MarkupText whose glyph outlines survive between renders and workers"""
+
+
+def normalize_markup(markup):
+    """The markup with every tag written one way: single quotes, single spaces"""
+    def normalize_tag(match):
+        return re.sub(r"\s+", " ", match.group(0)).replace('"', "'")
+
+    return re.sub(r"<[^>]*>", normalize_tag, markup)
+
+
+def markup_text(markup, **kwargs):
+    """A copy of the CachedMarkupText of this markup and style.
+
+    The first call parses, lays out and converts the markup, later calls
+    with the same normalized markup and keyword arguments only copy the
+    VMobjects built then.
+    """
+    markup = normalize_markup(markup)
+    key = (markup, repr(sorted(kwargs.items())))
+    template = _markup_templates.get(key)
+    if template is None:
+        template = CachedMarkupText(markup, **kwargs)
+        _markup_templates[key] = template
+        if len(_markup_templates) > MARKUP_TEMPLATES:
+            _markup_templates.popitem(last=False)
+    else:
+        _markup_templates.move_to_end(key)
+    return template.copy()
+
+
+def first_match_ranges(text, chars):
+    """Glyph ranges of the first occurrence of each of chars in text.
+
+    Glyph indices skip whitespace, as the submobjects of Text and MarkupText.
+    """
+    ranges = []
+    used = set()
+    glyph_index = 0
+    for char in text:
+        if char.isspace():
+            continue
+        if char in chars and char not in used:
+            ranges.append((glyph_index, glyph_index + 1))
+            used.add(char)
+        glyph_index += 1
+    return ranges
+
+
+def color_ranges(text, ranges, color):
+    """Color the glyphs of every [start, end) range of a Text in place.
+
+    Replaces a span per range in the markup: the text is not parsed again,
+    only the fill and stroke colors of the glyphs change, opacity is kept.
+    """
+    rgb = color_to_rgb(color)
+    for start, end in ranges:
+        for glyph in text.submobjects[start:end]:
+            for mob in glyph.family_members_with_points():
+                for name in ("fill_rgbas", "stroke_rgbas"):
+                    rgbas = getattr(mob, name)
+                    setattr(mob, name, np.hstack([np.tile(rgb, (len(rgbas), 1)), rgbas[:, 3:]]))
+    return text
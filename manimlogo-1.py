@@ -1,9 +1,14 @@
 from manim import *
 import numpy as np
 
+from alignment import PlannedTransform
+from fastrender import FastScene
+from glyphcache import CachedText
+from riemann import RiemannRectangles, RiemannRefinement
+
 NEW_BLUE = "#68a8e1"
 
-class Thumbnail(Scene):
+class Thumbnail(FastScene):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Configuration for axes
@@ -92,34 +97,11 @@ class Thumbnail(Scene):
         if x_max is None:
             x_max = self.x_max
             
-        func = graph.underlying_function
-        rectangles = VGroup()
-        
-        x_values = np.arange(x_min, x_max, dx)
-        n_rects = len(x_values)
-        
-        for i, x in enumerate(x_values):
-            height = func(x)
-            if height < 0:
-                continue
-                
-            # Color interpolation
-            alpha = i / max(1, n_rects - 1)
-            color = interpolate_color(start_color, end_color, alpha)
-            
-            # Create rectangle
-            rect = Rectangle(
-                width=dx * self.axes.x_length / (self.x_max - self.x_min),
-                height=height * self.axes.y_length / (self.y_max - self.y_min),
-                color=color,
-                **kwargs
-            )
-            
-            # Position rectangle
-            rect.move_to(self.coords_to_point(x + dx/2, height/2))
-            rectangles.add(rect)
-            
-        return rectangles
+        # All rectangles live in one vectorized mobject
+        return RiemannRectangles(
+            self.axes, graph.underlying_function, x_min, x_max, dx=dx,
+            start_color=start_color, end_color=end_color, **kwargs
+        )
         
     def get_riemann_rectangles_list(self, graph, n_iterations, start_color=BLUE, 
                                    end_color=GREEN, **kwargs):
@@ -139,12 +121,17 @@ class Thumbnail(Scene):
                                        replace_mobject_with_target_in_scene=False, 
                                        **kwargs):
         """Transform between different Riemann rectangle sets"""
+        # Sets of the same axes split/merge rectangles on their arrays
+        if RiemannRefinement.can_refine(start_rects, end_rects):
+            animation = RiemannRefinement(start_rects, end_rects)
+        else:
+            animation = PlannedTransform(start_rects, end_rects)
         if replace_mobject_with_target_in_scene:
-            self.play(Transform(start_rects, end_rects), **kwargs)
+            self.play(animation, **kwargs)
             self.remove(start_rects)
             self.add(end_rects)
         else:
-            self.play(Transform(start_rects, end_rects), **kwargs)
+            self.play(animation, **kwargs)
 
     def construct(self):
         self.show_function_graph()
@@ -217,10 +204,10 @@ class Thumbnail(Scene):
         output_triangle_p2.rotate(-PI/2)  # Point right
         
         # Labels
-        x_label_p1 = Text("a", color=WHITE, font_size=24)
-        output_label_p1 = Text("f(a)", color=WHITE, font_size=24)
-        x_label_p2 = Text("b", color=WHITE, font_size=24)
-        output_label_p2 = Text("f(b)", color=WHITE, font_size=24)
+        x_label_p1 = CachedText("a", color=WHITE, font_size=24)
+        output_label_p1 = CachedText("f(a)", color=WHITE, font_size=24)
+        x_label_p2 = CachedText("b", color=WHITE, font_size=24)
+        output_label_p2 = CachedText("f(b)", color=WHITE, font_size=24)
         
         # Lines and dots
         v_line_p1 = get_v_line(input_tracker_p1)
@@ -313,13 +300,13 @@ class Thumbnail(Scene):
         # Add "Manim" text
         picture = Group(*self.mobjects)
         picture.scale(0.6).to_edge(LEFT, buff=SMALL_BUFF)
-        manim = Text("Manim", font_size=72).next_to(picture, RIGHT).shift(DOWN * 0.7)
+        manim = CachedText("Manim", font_size=72).next_to(picture, RIGHT).shift(DOWN * 0.7)
         self.add(manim)
         
         self.wait(2)
 
 # Simpler version without some complex features
-class SimpleThumbnail(Scene):
+class SimpleThumbnail(FastScene):
     def construct(self):
         # Setup axes
         axes = Axes(
@@ -366,10 +353,10 @@ class SimpleThumbnail(Scene):
         )
         
         # Labels
-        label_a = Text("a", color=WHITE, font_size=24).next_to(v_line1, DOWN)
-        label_b = Text("b", color=WHITE, font_size=24).next_to(v_line2, DOWN)
-        label_fa = Text("f(a)", color=WHITE, font_size=24).next_to(h_line1, LEFT)
-        label_fb = Text("f(b)", color=WHITE, font_size=24).next_to(h_line2, LEFT)
+        label_a = CachedText("a", color=WHITE, font_size=24).next_to(v_line1, DOWN)
+        label_b = CachedText("b", color=WHITE, font_size=24).next_to(v_line2, DOWN)
+        label_fa = CachedText("f(a)", color=WHITE, font_size=24).next_to(h_line1, LEFT)
+        label_fb = CachedText("f(b)", color=WHITE, font_size=24).next_to(h_line2, LEFT)
         
         # Secant line
         secant = Line(
@@ -417,7 +404,7 @@ class SimpleThumbnail(Scene):
         # Scale and add title
         everything = Group(*self.mobjects)
         everything.scale(0.6).to_edge(LEFT)
-        title = Text("Manim", font_size=72).next_to(everything, RIGHT).shift(DOWN * 0.7)
+        title = CachedText("Manim", font_size=72).next_to(everything, RIGHT).shift(DOWN * 0.7)
         self.add(title)
         
         self.wait(2)
\ No newline at end of file
@@ -1,7 +1,13 @@
 from manim import *
 import numpy as np
 
-class LogoGeneration(Scene):
+from alignment import PlannedTransform
+from fastrender import FastScene
+from glyphcache import CachedText
+from sphere import ShadedSphere
+from vertexcolor import color_conditions, set_color_by_function
+
+class LogoGeneration(FastScene):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Configuration parameters
@@ -42,28 +48,8 @@ class LogoGeneration(Scene):
         return mesh
         
     def create_sphere_approximation(self):
-        """Create a 3D-looking sphere using circles and shading"""
-        # Main sphere outline
-        main_circle = Circle(radius=self.radius, color=self.sphere_blue)
-        main_circle.set_fill(self.sphere_blue, opacity=0.6)
-        
-        # Add shading circles to create 3D effect
-        shading_circles = VGroup()
-        
-        # Highlight circle (top-left)
-        highlight = Circle(radius=self.radius * 0.3, color=WHITE)
-        highlight.set_fill(WHITE, opacity=0.4)
-        highlight.shift(UP * 0.3 + LEFT * 0.3)
-        
-        # Shadow circles for depth
-        for i in range(3):
-            shadow_radius = self.radius * (0.8 - i * 0.2)
-            shadow = Circle(radius=shadow_radius, color=self.sphere_blue)
-            shadow.set_fill(self.sphere_blue, opacity=0.3 - i * 0.1)
-            shadow.shift(DOWN * 0.1 * i + RIGHT * 0.1 * i)
-            shading_circles.add(shadow)
-            
-        sphere = VGroup(main_circle, shading_circles, highlight)
+        """Create a shaded sphere, lit from the top left"""
+        sphere = ShadedSphere(radius=self.radius, color=self.sphere_blue)
         
         # Apply rotations to simulate 3D perspective
         sphere.rotate(-PI/7, axis=RIGHT)
@@ -72,12 +58,18 @@ class LogoGeneration(Scene):
         return sphere
         
     def apply_color_conditions(self, mobject, brown_color):
-        """Apply color conditions to simulate the original lambda functions"""
-        # This is a simplified version since we can't easily access individual points
-        # in modern Manim the same way as the old version
-        
-        # Create a gradient effect to simulate the original coloring
-        mobject.set_color(brown_color)
+        """Apply the color conditions of the original lambda functions, point by point"""
+        # Brown in the upper left quarter, black inside the pupil, the
+        # mobject's own color elsewhere
+        set_color_by_function(mobject, color_conditions(
+            mobject.family_members_with_points()[0].get_color(),
+            (lambda points: (points[:, 0] < 0) & (points[:, 1] > 0), brown_color),
+            (
+                lambda points: np.linalg.norm(points, axis=1)
+                < self.inner_radius_ratio * self.radius,
+                BLACK,
+            ),
+        ))
         
         # Add inner black circle
         inner_circle = Circle(
@@ -121,7 +113,7 @@ class LogoGeneration(Scene):
         circle_colored = self.apply_color_conditions(circle, self.circle_brown)
         
         # Create the name text
-        name_text = Text("3Blue1Brown", color=GREY, font_size=36)
+        name_text = CachedText("3Blue1Brown", color=GREY, font_size=36)
         name_text.shift(2 * DOWN)
         
         # Animation sequence
@@ -130,7 +122,7 @@ class LogoGeneration(Scene):
         
         # Transform circle to iris
         self.play(
-            Transform(circle_colored, iris_colored),
+            PlannedTransform(circle_colored, iris_colored),
             run_time=self.run_time
         )
         
@@ -152,7 +144,7 @@ class LogoGeneration(Scene):
         self.wait(1)
 
 # Alternative simpler version focusing on the core transformation
-class SimpleLogoGeneration(Scene):
+class SimpleLogoGeneration(FastScene):
     def construct(self):
         # Simple circle to sphere transformation
         circle = Circle(radius=1.5, color=BLUE_B)
@@ -171,22 +163,14 @@ class SimpleLogoGeneration(Scene):
             
         circle_with_lines = VGroup(circle, lines)
         
-        # Target sphere-like shape
-        sphere = Circle(radius=1.5, color=BLUE_D)
-        sphere.set_fill(BLUE_D, opacity=0.6)
-        
-        # Add 3D shading effect
-        highlight = Circle(radius=0.4, color=WHITE)
-        highlight.set_fill(WHITE, opacity=0.3)
-        highlight.shift(UP * 0.4 + LEFT * 0.4)
-        
-        sphere_with_shading = VGroup(sphere, highlight)
+        # Target sphere, shaded with the highlight at the top left
+        sphere_with_shading = ShadedSphere(radius=1.5, color=BLUE_D, fill_opacity=0.8)
         
         # Inner black circle (pupil)
         pupil = Circle(radius=0.8, color=BLACK, fill_opacity=1)
         
         # Text
-        text = Text("3Blue1Brown", color=GREY, font_size=36)
+        text = CachedText("3Blue1Brown", color=GREY, font_size=36)
         text.shift(2 * DOWN)
         
         # Animation
@@ -194,7 +178,7 @@ class SimpleLogoGeneration(Scene):
         self.wait(0.5)
         
         self.play(
-            Transform(circle_with_lines, sphere_with_shading),
+            PlannedTransform(circle_with_lines, sphere_with_shading),
             run_time=3
         )
         
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+
+from manim import *
+import numpy as np
+
+# Normalized shape keys per text mobject, so a title card that is built again
+# (same markup, same font, same glyph outlines) skips the per-glyph hashing
+SHAPE_KEY_CACHE_SIZE = 256
+_shape_key_cache = OrderedDict()
+
+
+def shape_key(points, decimals=3):
+    """Hash of the points centered on their bounding box and scaled to unit height.
+
+    Same normalization as TransformMatchingShapes.get_mobject_key, computed on
+    the array directly instead of through save_state/center/set/restore.
+    """
+    if len(points) == 0:
+        return hash(b"")
+    mins = points.min(axis=0)
+    maxs = points.max(axis=0)
+    normalized = points - (mins + maxs) / 2
+    height = maxs[1] - mins[1]
+    if height > 0:
+        normalized = normalized / height
+    # + 0.0 folds -0.0 into 0.0 so both hash the same
+    return hash((np.round(normalized, decimals) + 0.0).tobytes())
+
+
+def text_identity(mobject, parts):
+    """Cache key of a text mobject, None when it is not a text.
+
+    Besides the text and font it fingerprints the outlines of all parts at
+    once: moved or scaled copies share the keys, stretched or rotated ones
+    and other markup spans over the same text don't.
+    """
+    text = getattr(mobject, "text", None)
+    if not isinstance(text, str):
+        return None
+    points = [part.points for part in parts]
+    return (
+        type(mobject).__name__,
+        text,
+        getattr(mobject, "font", None),
+        getattr(mobject, "weight", None),
+        getattr(mobject, "slant", None),
+        tuple(map(len, points)),
+        shape_key(np.concatenate(points), decimals=6) if points else None,
+    )
+
+
+class IndexedTransformMatchingShapes(TransformMatchingShapes):
+    """TransformMatchingShapes with vectorized glyph hashing.
+
+    Every part gets one normalized geometric hash, parts are bucketed by
+    hash in a single pass, and the hashes of a text are cached by its markup,
+    font and outline fingerprint, so building the same source/target pair
+    again is a lookup.
+    """
+
+    @staticmethod
+    def get_mobject_key(mobject):
+        return shape_key(mobject.points)
+
+    def get_part_keys(self, mobject, parts):
+        identity = text_identity(mobject, parts)
+        if identity is not None and identity in _shape_key_cache:
+            _shape_key_cache.move_to_end(identity)
+            return _shape_key_cache[identity]
+        keys = [self.get_mobject_key(part) for part in parts]
+        if identity is not None:
+            _shape_key_cache[identity] = keys
+            if len(_shape_key_cache) > SHAPE_KEY_CACHE_SIZE:
+                _shape_key_cache.popitem(last=False)
+        return keys
+
+    def get_shape_map(self, mobject):
+        parts = self.get_mobject_parts(mobject)
+        group_class = mobject.get_group_class()
+        shape_map = {}
+        for part, key in zip(parts, self.get_part_keys(mobject, parts)):
+            if key not in shape_map:
+                shape_map[key] = group_class()
+            shape_map[key].add(part)
+        return shape_map
@@ -0,0 +1,81 @@
+from manim import *
+import numpy as np
+
+from styleanim import StyleAnimateMixin
+
+
+class Particles(StyleAnimateMixin, PMobject):
+    """Round particles stored as arrays, one row per particle.
+
+    points, rgbas (opacity in the alpha column), radii and velocities are
+    updated in one NumPy operation per frame instead of one mobject per
+    particle. Needs a scene using FastCamera (see fastrender.FastScene),
+    which draws them as filled discs.
+    """
+
+    def __init__(self, radius=0.02, **kwargs):
+        self.radius = radius
+        super().__init__(stroke_width=0, **kwargs)
+
+    def reset_points(self):
+        super().reset_points()
+        self.radii = np.zeros(0)
+        self.velocities = np.zeros((0, 3))
+        return self
+
+    def get_array_attrs(self):
+        return super().get_array_attrs() + ["radii", "velocities"]
+
+    def add_points(self, points, rgbas=None, color=None, alpha=1, radii=None, velocities=None):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        super().add_points(points, rgbas=rgbas, color=color, alpha=alpha)
+        radii = self.radius if radii is None else radii
+        velocities = 0.0 if velocities is None else velocities
+        self.radii = np.append(self.radii, np.broadcast_to(radii, len(points)))
+        self.velocities = np.append(
+            self.velocities, np.broadcast_to(velocities, (len(points), 3)), axis=0,
+        )
+        return self
+
+    def set_opacity(self, opacity, family=True):
+        mobs = self.family_members_with_points() if family else [self]
+        for mob in mobs:
+            mob.rgbas[:, 3] = opacity
+        return self
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        super().interpolate_color(mobject1, mobject2, alpha)
+        self.radii = interpolate(mobject1.radii, mobject2.radii, alpha)
+        return self
+
+    def step(self, dt, drag=0.0, gravity=ORIGIN):
+        """Move every particle along its velocity, for use as an updater"""
+        self.velocities += np.asarray(gravity) * dt
+        if drag:
+            self.velocities *= np.exp(-drag * dt)
+        self.points += self.velocities * dt
+        return self
+
+
+class Emitter:
+    """Seeded particle source, a given seed emits the same sparks on every render"""
+
+    def __init__(self, seed=0, spread=0.5, speed=0.0, radius=0.02, color=WHITE, opacity=1.0):
+        self.rng = np.random.default_rng(seed)
+        self.spread = spread
+        self.speed = speed
+        self.radius = radius
+        self.color = color
+        self.opacity = opacity
+
+    def emit(self, particles, center, n):
+        """Add n particles uniformly around center, moving in random directions"""
+        offsets = self.rng.uniform(-self.spread, self.spread, (n, 3))
+        velocities = self.rng.normal(0, self.speed, (n, 3)) if self.speed else None
+        return particles.add_points(
+            np.asarray(center) + offsets,
+            color=self.color,
+            alpha=self.opacity,
+            radii=self.radius,
+            velocities=velocities,
+        )
@@ -0,0 +1,114 @@
+"""Timed spans around the play loop, dumped as a Chrome trace.
+
+    MANIM_TRACE=media/traces python render_all.py re4lity.py --scene Re4lityAdvanced
+
+writes media/traces/Re4lityAdvanced.trace.json (one <Scene>_shardNNN file
+per shard with shard.py), which opens in chrome://tracing, ui.perfetto.dev
+or speedscope.app. Every play is split into compile (building the .animate
+copies), begin, interpolate and update_mobjects per animation (the members
+of animation groups included), rasterize, write, and encode on the writer
+thread. A span costs two clock reads and a tuple append, nothing is
+attached while the variable is unset.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+TRACE_ENV = "MANIM_TRACE"
+
+
+class Tracer:
+    """Collects spans of a scene's play loop, attach() it before render()"""
+
+    def __init__(self):
+        self.events = []  # (name, start ns, end ns, thread id, args)
+        self.pid = os.getpid()
+
+    def wrap(self, name, func, args=None):
+        """Return func timed as a span, args is shared by all its spans"""
+        events = self.events
+        clock = time.perf_counter_ns
+        ident = threading.get_ident
+
+        def traced(*a, **kw):
+            start = clock()
+            try:
+                return func(*a, **kw)
+            finally:
+                events.append((name, start, clock(), ident(), args))
+
+        return traced
+
+    def attach(self, scene):
+        """Trace the scene's plays, its renderer and its file writer"""
+        renderer = scene.renderer
+        file_writer = renderer.file_writer
+        begin_animations = scene.begin_animations
+
+        def traced_begin_animations():
+            for animation in scene.animations:
+                self.attach_animation(animation)
+            begin_animations()
+
+        scene.begin_animations = self.wrap("begin", traced_begin_animations)
+        scene.compile_animation_data = self.wrap("compile", scene.compile_animation_data)
+        scene.update_mobjects = self.wrap("update_mobjects", scene.update_mobjects)
+        renderer.play = self.wrap("play", renderer.play)
+        renderer.save_static_frame_data = self.wrap(
+            "rasterize static", renderer.save_static_frame_data,
+        )
+        renderer.update_frame = self.wrap("rasterize", renderer.update_frame)
+        renderer.add_frame = self.wrap("write", renderer.add_frame)
+        file_writer.encode_and_write_frame = self.wrap(
+            "encode", file_writer.encode_and_write_frame,
+        )
+        file_writer.combine_to_movie = self.wrap("combine", file_writer.combine_to_movie)
+        return self
+
+    def attach_animation(self, animation):
+        """Trace an animation and, inside groups (TimelinePass too), each of its own"""
+        args = {"animation": str(animation), "mobject": str(animation.mobject)}
+        for name in ("begin", "interpolate", "update_mobjects", "finish"):
+            setattr(animation, name, self.wrap(name, getattr(animation, name), args))
+        for child in getattr(animation, "animations", ()):
+            self.attach_animation(child)
+
+    def to_chrome_trace(self):
+        """Complete events of the Trace Event Format, times in microseconds"""
+        threads = {}
+        events = []
+        for name, start, end, thread, args in self.events:
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self.pid,
+                "tid": threads.setdefault(thread, len(threads)),
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return path
+
+
+def trace_from_env(scene):
+    """Attach a Tracer when MANIM_TRACE is set, else return None"""
+    if not os.environ.get(TRACE_ENV):
+        return None
+    return Tracer().attach(scene)
+
+
+def dump_from_env(tracer, name):
+    """Write the trace to $MANIM_TRACE/<name>.trace.json, return its path"""
+    if tracer is None:
+        return None
+    return tracer.dump(Path(os.environ[TRACE_ENV]) / f"{name}.trace.json")
@@ -1,6 +1,12 @@
 from manim import *
 
-class Re4lityFadeIn(Scene):
+from fastrender import FastScene
+from glow import GlowText, fill_layer, stroke_layer
+from glyphcache import CachedText
+from particles import Emitter, Particles
+from timeline import Timeline
+
+class Re4lityFadeIn(FastScene):
     def construct(self):
         # 近未来的な紫のグラデーション色を定義
         neon_purple = "#8B00FF"
@@ -12,7 +18,7 @@ class Re4lityFadeIn(Scene):
         self.camera.background_color = BLACK
         
         # テキストを作成（大きくて太いフォント）
-        text = Text(
+        text = CachedText(
             "re4lity",
             font_size=72,
             font="Arial",
@@ -20,97 +26,69 @@ class Re4lityFadeIn(Scene):
         )
         text.move_to(ORIGIN)
         
-        # 文字の輪郭のみのバージョンを作成
-        outline_text = text.copy()
-        outline_text.set_fill(opacity=0)  # 塗りつぶしを透明に
-        outline_text.set_stroke(color=neon_purple, width=3, opacity=0)  # 輪郭を紫に
-        
-        # 塗りつぶし版を作成（グラデーション効果）
-        filled_text = text.copy()
-        filled_text.set_fill(color=[electric_purple, cyber_purple, light_purple], opacity=0)
-        filled_text.set_stroke(color=neon_purple, width=2, opacity=0)
-        
-        # グロー効果用のテキスト（背景の光る効果）
-        glow_text = text.copy()
-        glow_text.set_fill(opacity=0)
-        glow_text.set_stroke(color=light_purple, width=8, opacity=0)
+        # 全レイヤーを1つのグリフ形状で共有（グロー、塗りつぶし、輪郭）
+        GLOW, FILL, FILL_STROKE, OUTLINE = range(4)
+        layered_text = GlowText(text, [
+            # グロー効果（背景の光る効果）
+            stroke_layer(light_purple, 8, opacity=0),
+            # 塗りつぶし（グラデーション効果）
+            fill_layer([electric_purple, cyber_purple, light_purple], opacity=0),
+            stroke_layer(neon_purple, 2, opacity=0),
+            # 輪郭
+            stroke_layer(neon_purple, 3, opacity=0),
+        ])
         
-        # 全てのテキストをシーンに追加
-        self.add(glow_text, filled_text, outline_text)
+        # シーンに追加
+        self.add(layered_text)
         
         # アニメーション開始
-        # 各文字を個別にアニメーション
-        animations = []
+        # 各文字を個別にアニメーション、開始時刻をずらしてタイムラインに配置
+        timeline = Timeline()
         
-        for i, char in enumerate("re4lity"):
-            # 遅延を追加して左から右へのエフェクトを作成
-            delay = i * 0.15
-            
-            # 輪郭のフェードイン
-            outline_fadein = outline_text[i].animate.set_stroke(opacity=1)
-            outline_fadein.run_time = 0.8
-            
-            # グロー効果のフェードイン
-            glow_fadein = glow_text[i].animate.set_stroke(opacity=0.3)
-            glow_fadein.run_time = 1.2
-            
-            # 塗りつぶしのフェードイン（輪郭の後に開始）
-            fill_fadein = filled_text[i].animate.set_fill(opacity=0.9).set_stroke(opacity=0.8)
-            fill_fadein.run_time = 1.0
-            
-            # アニメーションをタイムラインに追加
-            animations.extend([
-                AnimationGroup(
-                    outline_fadein,
-                    glow_fadein,
-                    lag_ratio=0.2
-                ),
-                fill_fadein
-            ])
-        
-        # 左から右へ段階的にアニメーション実行
         for i in range(len("re4lity")):
+            # 遅延を追加して左から右へのエフェクトを作成
             delay = i * 0.2
             
-            # 各文字のアニメーション
-            self.play(
-                outline_text[i].animate.set_stroke(opacity=1),
-                glow_text[i].animate.set_stroke(opacity=0.3),
+            # 輪郭とグロー効果のフェードイン
+            timeline.add(
+                layered_text[i].animate.set_layer(OUTLINE, opacity=1).set_layer(GLOW, opacity=0.3),
+                at=delay,
                 run_time=0.6
             )
             
-            # 少し遅れて塗りつぶし
-            self.play(
-                filled_text[i].animate.set_fill(opacity=0.9).set_stroke(opacity=0.8),
+            # 塗りつぶしのフェードイン（輪郭の後に開始）
+            timeline.add(
+                layered_text[i].animate.set_layer(FILL, opacity=0.9).set_layer(FILL_STROKE, opacity=0.8),
+                at=delay + 0.6,
                 run_time=0.8
             )
-            
-            # 短い間隔
-            self.wait(0.1)
         
         # 最終的な光る効果
-        self.play(
-            glow_text.animate.set_stroke(opacity=0.5),
+        timeline.add(
+            layered_text.animate.set_layer(GLOW, opacity=0.5),
             run_time=0.5
         )
         
         # パルス効果（オプション）
         for _ in range(2):
-            self.play(
-                glow_text.animate.set_stroke(opacity=0.7),
+            timeline.add(
+                layered_text.animate.set_layer(GLOW, opacity=0.7),
                 run_time=0.3
             )
-            self.play(
-                glow_text.animate.set_stroke(opacity=0.3),
+            timeline.add(
+                layered_text.animate.set_layer(GLOW, opacity=0.3),
                 run_time=0.3
             )
         
         # 最後に少し待機
-        self.wait(2)
+        timeline.wait(2)
+        
+        # 最小限の play 呼び出しにまとめて再生
+        timeline.play(self)
 
 
 # より高度なバージョン（パーティクル効果付き）
-class Re4lityAdvanced(Scene):
+class Re4lityAdvanced(FastScene):
     def construct(self):
         # 色定義
         neon_purple = "#8B00FF"
@@ -121,7 +99,7 @@ class Re4lityAdvanced(Scene):
         self.camera.background_color = BLACK
         
         # メインテキスト
-        text = Text(
+        text = CachedText(
             "re4lity",
             font_size=84,
             font="Arial",
@@ -129,29 +107,25 @@ class Re4lityAdvanced(Scene):
         )
         text.move_to(ORIGIN)
         
-        # 複数レイヤーのテキスト作成
-        # 1. 背景グロー（大きな光）
-        bg_glow = text.copy()
-        bg_glow.set_fill(opacity=0)
-        bg_glow.set_stroke(color=light_purple, width=15, opacity=0)
-        
-        # 2. ミドルグロー
-        mid_glow = text.copy()
-        mid_glow.set_fill(opacity=0)
-        mid_glow.set_stroke(color=cyber_purple, width=8, opacity=0)
-        
-        # 3. 輪郭
-        outline = text.copy()
-        outline.set_fill(opacity=0)
-        outline.set_stroke(color=neon_purple, width=3, opacity=0)
-        
-        # 4. 塗りつぶし
-        filled = text.copy()
-        filled.set_fill(color=[electric_purple, neon_purple], opacity=0)
-        filled.set_stroke(color=neon_purple, width=1, opacity=0)
+        # 複数レイヤーのテキスト作成（グリフ形状は共有）
+        BG_GLOW, MID_GLOW, OUTLINE, FILL, FILL_STROKE = range(5)
+        layered_text = GlowText(text, [
+            # 1. 背景グロー（大きな光）
+            stroke_layer(light_purple, 15, opacity=0),
+            # 2. ミドルグロー
+            stroke_layer(cyber_purple, 8, opacity=0),
+            # 3. 輪郭
+            stroke_layer(neon_purple, 3, opacity=0),
+            # 4. 塗りつぶし
+            fill_layer([electric_purple, neon_purple], opacity=0),
+            stroke_layer(neon_purple, 1, opacity=0),
+        ])
         
         # シーンに追加
-        self.add(bg_glow, mid_glow, outline, filled)
+        self.add(layered_text)
+        
+        # スパーク効果用のパーティクル（シード固定で毎回同じ配置）
+        emitter = Emitter(seed=0, spread=0.5, radius=0.02, color=light_purple)
         
         # 左から右へのアニメーション
         for i in range(len("re4lity")):
@@ -159,48 +133,39 @@ class Re4lityAdvanced(Scene):
             char_center = text[i].get_center()
             
             # スパーク効果用の小さなドット
-            sparks = VGroup()
-            for _ in range(8):
-                spark = Dot(
-                    point=char_center + np.random.uniform(-0.5, 0.5, 3),
-                    radius=0.02,
-                    color=light_purple
-                )
-                sparks.add(spark)
+            sparks = emitter.emit(Particles(), char_center, 8)
             
             # アニメーション実行
             self.play(
-                # グロー効果
-                bg_glow[i].animate.set_stroke(opacity=0.2),
-                mid_glow[i].animate.set_stroke(opacity=0.4),
-                # 輪郭出現
-                outline[i].animate.set_stroke(opacity=1.0),
+                # グロー効果と輪郭出現
+                layered_text[i].animate
+                    .set_layer(BG_GLOW, opacity=0.2)
+                    .set_layer(MID_GLOW, opacity=0.4)
+                    .set_layer(OUTLINE, opacity=1.0),
                 # スパーク出現
-                *[spark.animate.set_opacity(1) for spark in sparks],
+                sparks.animate.set_opacity(1),
                 run_time=0.5
             )
             
             # 塗りつぶしとスパーク消失
             self.play(
-                filled[i].animate.set_fill(opacity=0.85).set_stroke(opacity=0.9),
-                *[spark.animate.set_opacity(0) for spark in sparks],
+                layered_text[i].animate.set_layer(FILL, opacity=0.85).set_layer(FILL_STROKE, opacity=0.9),
+                sparks.animate.set_opacity(0),
                 run_time=0.7
             )
             
             # スパークを削除
-            self.remove(*sparks)
+            self.remove(sparks)
             
             self.wait(0.05)
         
         # 最終パルス効果
         self.play(
-            bg_glow.animate.set_stroke(opacity=0.4),
-            mid_glow.animate.set_stroke(opacity=0.6),
+            layered_text.animate.set_layer(BG_GLOW, opacity=0.4).set_layer(MID_GLOW, opacity=0.6),
             run_time=0.3
         )
         self.play(
-            bg_glow.animate.set_stroke(opacity=0.2),
-            mid_glow.animate.set_stroke(opacity=0.4),
+            layered_text.animate.set_layer(BG_GLOW, opacity=0.2).set_layer(MID_GLOW, opacity=0.4),
             run_time=0.5
         )
         
@@ -1,32 +1,26 @@
 from manim import *
 
+from glyphcache import CachedText, color_ranges, first_match_ranges, markup_text
+from matching import IndexedTransformMatchingShapes
+
 class RealityAnimation(Scene):
     def construct(self):
         # ==== 元のテキスト設定 ====
         src_text = "Let’s catch the frailty"
         target_chars = list("reality")
 
-        def apply_first_match_color(text, match_chars, color="red"):
-            result = ""
-            used_chars = set()
-            for c in text:
-                if c in match_chars and c not in used_chars:
-                    result += f"<span foreground='{color}'>{c}</span>"
-                    used_chars.add(c)
-                else:
-                    result += c
-            return result
-
         # 元と変換後テキスト（中央表示）
-        src_markup = apply_first_match_color(src_text, target_chars)
         tar_markup = "<span foreground='red'>reality</span> has left the chat"
 
-        src = MarkupText(src_markup).move_to(ORIGIN)
-        tar = MarkupText(tar_markup).move_to(ORIGIN)
+        # 最初に一致した文字だけ赤(spanを足して組み直さず、グリフの色を変える)
+        src = markup_text(src_text)
+        color_ranges(src, first_match_ranges(src_text, target_chars), PURE_RED)
+        src.move_to(ORIGIN)
+        tar = markup_text(tar_markup).move_to(ORIGIN)
 
         self.play(Write(src))
         self.wait(0.5)
-        self.play(TransformMatchingShapes(src, tar, path_arc=PI / 2))
+        self.play(IndexedTransformMatchingShapes(src, tar, path_arc=PI / 2))
         self.wait(0.5)
 
         # ==== フェードアウト対象：has left the chat ====
@@ -42,7 +36,7 @@ class RealityAnimation(Scene):
         colors = ["#FF0000", "#FF0000", "#3355FF", "#FF0000", "#FF0000", "#FF0000", "#FF0000"]
 
         for i, (char, color) in enumerate(zip(letters, colors)):
-            t = Text(char, color=color)
+            t = CachedText(char, color=color)
             t.move_to(reality_text[i])  # 各文字を元の位置に
             re4lity.add(t)
 
@@ -0,0 +1,303 @@
+"""Render every scene of the catalog scripts in a pool of worker processes.
+
+Usage:
+    python render_all.py                      # every Scene in every script
+    python render_all.py re4lity.py           # only the scenes of re4lity.py
+    python render_all.py --scene Thumbnail --memory 4
+"""
+import argparse
+import ast
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+SUMMARY_FILE = ROOT / "media" / "render_summary.json"
+GIB = 1024 ** 3
+RANDOM_SEED = 0
+# Seconds between two reads of a worker's resident memory
+MEMORY_POLL_INTERVAL = 0.2
+
+
+def find_scenes(paths):
+    """Return (script, class name) for every Scene subclass defined in the scripts"""
+    jobs = []
+    for path in paths:
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+        scene_names = set()
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = [
+                base.id if isinstance(base, ast.Name) else getattr(base, "attr", "")
+                for base in node.bases
+            ]
+            is_scene = any(
+                base.endswith("Scene") or base in scene_names for base in bases
+            )
+            # Base classes without construct() (FastScene and friends) are not renderable
+            has_construct = any(
+                isinstance(item, ast.FunctionDef) and item.name == "construct"
+                for item in node.body
+            )
+            if is_scene:
+                scene_names.add(node.name)
+                if has_construct or any(base in scene_names for base in bases):
+                    jobs.append((Path(path), node.name))
+    return jobs
+
+
+def total_memory():
+    """Physical memory of this machine in bytes"""
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+
+
+def pool_size(memory_budget, jobs=None):
+    """Number of workers: one per core, but never more than the memory budget allows"""
+    workers = jobs or os.cpu_count() or 1
+    if memory_budget:
+        workers = min(workers, max(1, total_memory() // memory_budget))
+    return workers
+
+
+def tile_workers(workers):
+    """Band painting threads per worker process, so the pool doesn't oversubscribe the cores"""
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def resident_memory():
+    """Resident memory of this process in bytes, None where /proc is missing"""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+# Resident memory budget of the jobs of this worker, set by init_worker
+_memory_budget = None
+# Stop event of the watcher of the running job, None while no job is watched
+_memory_watch = None
+
+
+def raise_memory_error(signum, frame):
+    # A signal sent just before the job ended is dropped
+    if _memory_watch is not None:
+        raise MemoryError
+
+
+def watch_memory(memory_budget, stop):
+    """Signal the main thread once when the RSS of this process exceeds the budget"""
+    while not stop.wait(MEMORY_POLL_INTERVAL):
+        rss = resident_memory()
+        if rss is None:
+            return
+        if rss > memory_budget:
+            os.kill(os.getpid(), signal.SIGUSR1)
+            return
+
+
+def arm_memory_watch():
+    """Watch the memory of the job about to run, return the event that stops it"""
+    global _memory_watch
+    if not _memory_budget:
+        return None
+    _memory_watch = threading.Event()
+    threading.Thread(
+        target=watch_memory, args=(_memory_budget, _memory_watch), daemon=True,
+    ).start()
+    return _memory_watch
+
+
+def disarm_memory_watch(stop):
+    global _memory_watch
+    _memory_watch = None
+    if stop is not None:
+        stop.set()
+
+
+def init_worker(memory_budget, tile_threads=None):
+    """Set the per-job memory budget and pay the manim import once per worker"""
+    global _memory_budget
+    os.chdir(ROOT)  # so manim.cfg is picked up
+    if memory_budget:
+        # The resident memory, not the address space: glibc arenas, thread
+        # stacks and the libraries' reservations would count against RLIMIT_AS
+        _memory_budget = memory_budget
+        signal.signal(signal.SIGUSR1, raise_memory_error)
+    import manim  # noqa: F401
+
+    if tile_threads:
+        import fastrender
+
+        fastrender.TILE_WORKERS = tile_threads
+
+
+def load_scene_class(script, scene_name):
+    """Import a script (hyphenated names included) and return one of its scenes"""
+    from manim.utils.module_ops import scene_classes_from_file
+
+    for scene_class in scene_classes_from_file(Path(script), full_list=True):
+        if scene_class.__name__ == scene_name:
+            return scene_class
+    raise ValueError(f"{scene_name} not found in {script}")
+
+
+def scene_kwargs(scene_class, file_writer_class=None, renderer_class=None, **renderer_kwargs):
+    """Constructor arguments of a scene, with its own renderer when a class is given"""
+    # Fixed seed: random sparks must hash the same from one run to the next
+    kwargs = {"random_seed": RANDOM_SEED}
+    if file_writer_class is not None or renderer_class is not None:
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        renderer_class = renderer_class or getattr(scene_class, "renderer_class", CairoRenderer)
+        kwargs["renderer"] = renderer_class(
+            file_writer_class=file_writer_class
+            or getattr(scene_class, "file_writer_class", SceneFileWriter),
+            camera_class=getattr(scene_class, "default_camera_class", None),
+            **renderer_kwargs,
+        )
+    return kwargs
+
+
+def render_scene(script, scene_name, overrides=None, stream=False, renderer_class=None, **renderer_kwargs):
+    """Render one scene in the current process, return (scene, wall time)"""
+    from manim import tempconfig
+
+    from profiling import dump_from_env, trace_from_env
+
+    start = time.perf_counter()
+    # input_file keeps the output directory per script, reality.py and
+    # reality-extend.py both define RealityAnimation
+    with tempconfig({"input_file": str(script), **(overrides or {})}):
+        scene_class = load_scene_class(script, scene_name)
+        file_writer_class = None
+        if stream:
+            from writers import StreamingFileWriter
+
+            file_writer_class = StreamingFileWriter
+        scene = scene_class(**scene_kwargs(
+            scene_class, file_writer_class, renderer_class, **renderer_kwargs,
+        ))
+        tracer = trace_from_env(scene)
+        try:
+            scene.render()
+        except BaseException:
+            stop_writer(scene.renderer.file_writer)
+            raise
+    # Named after the movie, so the shards of a scene don't overwrite each other
+    dump_from_env(tracer, (overrides or {}).get("output_file", scene_name))
+    return scene, time.perf_counter() - start
+
+
+def stop_writer(file_writer):
+    """End the writer thread of a failed render, the process can't exit while it waits"""
+    thread = getattr(file_writer, "writer_thread", None)
+    if thread is not None and thread.is_alive():
+        file_writer.queue.put((-1, None))
+        thread.join()
+
+
+def output_file(scene):
+    """Path of the movie written by a rendered scene, None when nothing was written"""
+    path = getattr(scene.renderer.file_writer, "movie_file_path", None)
+    return str(path) if path else None
+
+
+def run_job(script, scene_name, overrides=None, stream=False):
+    """Pool entry point, errors are reported instead of raised"""
+    try:
+        stop = arm_memory_watch()
+        try:
+            scene, wall_time = render_scene(script, scene_name, overrides, stream)
+        finally:
+            disarm_memory_watch(stop)
+        return {"wall_time": wall_time, "output": output_file(scene)}
+    except MemoryError:
+        return {"error": "memory budget exceeded"}
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def render_all(jobs, memory_budget=None, workers=None, overrides=None, stream=False):
+    """Render the jobs concurrently and return one summary entry per scene"""
+    workers = pool_size(memory_budget, workers)
+    print(f"Rendering {len(jobs)} scenes with {workers} workers")
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(memory_budget, tile_workers(workers)),
+    ) as pool:
+        futures = {
+            pool.submit(run_job, str(script), scene_name, overrides, stream): (script, scene_name)
+            for script, scene_name in jobs
+        }
+        for future in as_completed(futures):
+            script, scene_name = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # The worker died (BrokenProcessPool), not the job
+                outcome = {"error": f"{type(e).__name__}: {e}"}
+            result = {"script": Path(script).name, "scene": scene_name, **outcome}
+            if "error" in result:
+                print(f"  FAILED {result['script']}:{scene_name} ({result['error']})")
+            else:
+                print(f"  {result['script']}:{scene_name} {result['wall_time']:.1f}s")
+            results.append(result)
+    return sorted(results, key=lambda r: (r["script"], r["scene"]))
+
+
+def write_summary(results, path, total_time):
+    """Write the wall time per scene as JSON"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    summary = {"total_wall_time": total_time, "scenes": results}
+    path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    print(f"Summary written to {path}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", help="scene scripts (default: all)")
+    parser.add_argument("--scene", action="append", help="only render these classes")
+    parser.add_argument("-j", "--jobs", type=int, help="number of workers (default: cores)")
+    parser.add_argument(
+        "--memory", type=float, default=None,
+        help="resident memory budget per job in GiB (default: none)",
+    )
+    parser.add_argument("--summary", default=SUMMARY_FILE, help="summary JSON path")
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="encode each scene in one pass, without partial movie files",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scripts = [Path(s).resolve() for s in args.scripts] or sorted(ROOT.glob("*.py"))
+    jobs = find_scenes(scripts)
+    if args.scene:
+        jobs = [job for job in jobs if job[1] in args.scene]
+    if not jobs:
+        print("No scenes found")
+        return 1
+
+    memory_budget = int(args.memory * GIB) if args.memory else None
+
+    start = time.perf_counter()
+    results = render_all(jobs, memory_budget, args.jobs, stream=args.stream)
+    write_summary(results, args.summary, time.perf_counter() - start)
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Keep manim imported and re-render scenes when their script is saved.
+
+Usage:
+    python renderd.py reality.py                           # render on save
+    python renderd.py re4lity.py --scene Re4lityFadeIn --preview
+    python renderd.py --send reality.py RealityAnimation   # from another shell
+
+The daemon pays the manim import once. It polls the watched scripts and the
+helper modules they import (fastrender.py, glow.py, ...): a saved script is
+executed again and its scenes rendered, a saved helper is dropped from
+sys.modules so that the next render imports the new version while manim
+itself stays loaded. Renders can also be requested over a local TCP socket,
+one JSON line per request; they are done one at a time, in the daemon's
+main thread.
+"""
+import argparse
+import json
+import queue
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+
+from render_all import ROOT, find_scenes, init_worker, run_job
+
+HOST = "127.0.0.1"
+PORT = 8765
+# Seconds between two checks of the watched files
+POLL_INTERVAL = 0.5
+
+
+def local_modules():
+    """Path of every module imported from the repository, by module name"""
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if name != "__main__" and path and Path(path).resolve().parent == ROOT:
+            modules[name] = Path(path).resolve()
+    return modules
+
+
+def forget_local_modules():
+    """Drop the repository's modules, the next render imports them again"""
+    for name in local_modules():
+        del sys.modules[name]
+
+
+class Watcher:
+    """Reports the watched scripts and loaded helpers modified since the last call"""
+
+    def __init__(self, scripts):
+        self.scripts = set(scripts)
+        self.mtimes = {}
+        self.changes()
+
+    def changes(self):
+        changed = []
+        for path in self.scripts | set(local_modules().values()) | set(self.mtimes):
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self.mtimes.setdefault(path, mtime) != mtime:
+                changed.append(path)
+                self.mtimes[path] = mtime
+        return changed
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Passes each JSON line to the render loop and writes back its results"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                results = [{"error": f"invalid request: {e}"}]
+            else:
+                reply = queue.Queue(maxsize=1)
+                self.server.requests.put((request, reply))
+                results = reply.get()
+            self.wfile.write((json.dumps(results) + "\n").encode("utf-8"))
+
+
+class RenderServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, requests):
+        super().__init__(address, RequestHandler)
+        self.requests = requests
+
+
+def select_jobs(scripts, scene_names=None):
+    """(script, scene) of the scenes to render, all of them when no name is given"""
+    jobs = find_scenes(scripts)
+    if scene_names:
+        jobs = [job for job in jobs if job[1] in scene_names]
+    return jobs
+
+
+def render(jobs, overrides=None, preview=False):
+    """Render the jobs in this process, return one result per scene"""
+    results = []
+    for script, scene_name in jobs:
+        result = {"script": Path(script).name, "scene": scene_name}
+        result.update(run_job(str(script), scene_name, overrides))
+        if "error" in result:
+            print(f"  FAILED {result['script']}:{scene_name} ({result['error']})")
+        else:
+            print(f"  {result['script']}:{scene_name} {result['wall_time']:.1f}s")
+            if preview and result["output"]:
+                from manim.utils.file_ops import open_file
+
+                open_file(Path(result["output"]))
+        results.append(result)
+    return results
+
+
+def handle_request(request, overrides, preview):
+    """Render the scenes named by a socket request"""
+    try:
+        script = (ROOT / request["script"]).resolve()
+        jobs = select_jobs([script], request.get("scenes"))
+    except (KeyError, OSError, SyntaxError) as e:
+        return [{"error": f"{type(e).__name__}: {e}"}]
+    if not jobs:
+        return [{"error": f"no scenes found in {request['script']}"}]
+    print(f"Request: {script.name} ({len(jobs)} scenes)")
+    return render(jobs, {**overrides, **request.get("overrides", {})}, preview)
+
+
+def handle_changes(changed, scripts, scene_names, overrides, preview):
+    """Render again what the modified files affect"""
+    changed_scripts = [path for path in changed if path in scripts]
+    if len(changed_scripts) < len(changed):
+        # A helper changed: every watched scene may use it
+        forget_local_modules()
+        changed_scripts = scripts
+    print(f"Changed: {', '.join(path.name for path in changed)}")
+    try:
+        jobs = select_jobs(changed_scripts, scene_names)
+    except SyntaxError as e:
+        print(f"  FAILED {e}")
+        return
+    render(jobs, overrides, preview)
+
+
+def serve(scripts, scene_names=None, overrides=None, port=PORT, preview=False):
+    """Watch the scripts and serve render requests until interrupted"""
+    init_worker(None)
+    # Pay the import of the helpers too, before the first render
+    import fastrender  # noqa: F401
+
+    overrides = overrides or {}
+    requests = queue.Queue()
+    server = RenderServer((HOST, port), requests)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    watcher = Watcher(scripts)
+    print(f"Watching {len(scripts)} scripts, listening on {HOST}:{port}")
+    try:
+        while True:
+            try:
+                request, reply = requests.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                changed = watcher.changes()
+                if changed:
+                    handle_changes(changed, scripts, scene_names, overrides, preview)
+            else:
+                reply.put(handle_request(request, overrides, preview))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+def send(script, scene_names=None, overrides=None, port=PORT):
+    """Ask a running daemon to render, print its results"""
+    request = {"script": str(Path(script).resolve()), "scenes": scene_names or None}
+    if overrides:
+        request["overrides"] = overrides
+    with socket.create_connection((HOST, port)) as connection:
+        connection.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        results = json.loads(connection.makefile("r", encoding="utf-8").readline())
+    for result in results:
+        if "error" in result:
+            print(f"FAILED {result.get('scene', script)}: {result['error']}")
+        else:
+            print(f"{result['scene']} {result['wall_time']:.1f}s -> {result['output']}")
+    return 1 if any("error" in result for result in results) else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", help="scene scripts (default: all)")
+    parser.add_argument("--scene", action="append", help="only render these classes")
+    parser.add_argument(
+        "--send", nargs="+", metavar=("SCRIPT", "SCENE"),
+        help="ask a running daemon to render a script (optionally only some scenes)",
+    )
+    parser.add_argument("--port", type=int, default=PORT, help=f"local port (default: {PORT})")
+    parser.add_argument("-p", "--preview", action="store_true", help="open each movie once rendered")
+    parser.add_argument("--width", type=int, help="pixel width (default: manim.cfg)")
+    parser.add_argument("--height", type=int, help="pixel height (default: manim.cfg)")
+    parser.add_argument("--fps", type=int, help="frame rate (default: manim.cfg)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    overrides = {
+        key: value
+        for key, value in (
+            ("pixel_width", args.width),
+            ("pixel_height", args.height),
+            ("frame_rate", args.fps),
+        )
+        if value
+    }
+    if args.send:
+        script, *scene_names = args.send
+        return send(script, scene_names + (args.scene or []), overrides, args.port)
+    scripts = [Path(s).resolve() for s in args.scripts] or sorted(
+        path for path in ROOT.glob("*.py") if find_scenes([path])
+    )
+    return serve(scripts, args.scene, overrides, args.port, args.preview)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+from manim import *
+from manim.utils.iterables import stretch_array_to_length
+import numpy as np
+
+# Points of one rectangle: 4 straight edges, each stored as a cubic bezier
+POINTS_PER_RECT = 16
+
+
+class RiemannRectangles(VMobject):
+    """All rectangles of a Riemann sum held in a single point buffer.
+
+    The function is evaluated once over the whole x array, corners and the
+    color gradient are computed as arrays, and every rectangle is one
+    subpath of this VMobject instead of a separate Rectangle. fill_rgbas
+    and stroke_rgbas hold one row per rectangle, which FastCamera paints
+    as one flat color per subpath (other cameras would make a gradient of
+    them).
+    """
+
+    def __init__(self, axes, func, x_min, x_max, dx=0.1, start_color=BLUE,
+                 end_color=GREEN, fill_opacity=0.0,
+                 stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        # Axes are linear, so keep the affine map instead of a reference to them
+        self.origin = np.array(axes.coords_to_point(0, 0))
+        self.x_unit = np.array(axes.coords_to_point(1, 0)) - self.origin
+        self.y_unit = np.array(axes.coords_to_point(0, 1)) - self.origin
+        self.dx = dx
+
+        x_values = np.arange(x_min, x_max, dx)
+        heights = self.evaluate(func, x_values)
+        # Same gradient position as the per-rectangle loop, skipped ones included
+        alphas = np.arange(len(x_values)) / max(1, len(x_values) - 1)
+
+        keep = heights >= 0
+        self.x_values = x_values[keep]
+        self.heights = heights[keep]
+        self.alphas = alphas[keep]
+        self.rgbs = interpolate(
+            color_to_rgb(start_color), color_to_rgb(end_color), self.alphas[:, None]
+        )
+
+        self.set_rect_colors(self.rgbs, fill_opacity=fill_opacity)
+        self.set_points(self.get_rect_points())
+
+    @staticmethod
+    def evaluate(func, x_values):
+        """Evaluate func over the whole array, one call when it is vectorizable"""
+        try:
+            values = np.asarray(func(x_values), dtype=float)
+        except (TypeError, ValueError):
+            values = np.array([func(x) for x in x_values], dtype=float)
+        return np.broadcast_to(values, x_values.shape).copy()
+
+    def get_num_rects(self):
+        return len(self.points) // POINTS_PER_RECT
+
+    def get_rect_points(self, x_values=None, widths=None, heights=None):
+        """Bezier points of all rectangles, in the corner order of Rectangle"""
+        x0 = self.x_values if x_values is None else x_values
+        x1 = x0 + (self.dx if widths is None else widths)
+        h = self.heights if heights is None else heights
+        zeros = np.zeros_like(h)
+        # UR, UL, DL, DR for every rectangle
+        xs = np.stack([x1, x0, x0, x1], axis=1)
+        ys = np.stack([h, h, zeros, zeros], axis=1)
+        corners = (
+            self.origin
+            + xs[..., None] * self.x_unit
+            + ys[..., None] * self.y_unit
+        )
+        ends = np.roll(corners, -1, axis=1)
+        t = np.linspace(0, 1, 4)[:, None]
+        curves = corners[:, :, None, :] + t * (ends - corners)[:, :, None, :]
+        return curves.reshape(-1, 3)
+
+    def set_rect_colors(self, rgbs, fill_opacity=None, stroke_opacity=None):
+        """One fill and stroke color per rectangle"""
+        if fill_opacity is None:
+            fill_opacity = self.get_fill_opacity()
+        if stroke_opacity is None:
+            stroke_opacity = self.get_stroke_opacity()
+        if len(rgbs) == 0:
+            return self
+        self.fill_rgbas = np.hstack([rgbs, np.full((len(rgbs), 1), fill_opacity)])
+        self.stroke_rgbas = np.hstack([rgbs, np.full((len(rgbs), 1), stroke_opacity)])
+        return self
+
+    def repeat_rects(self, n):
+        """Duplicate rectangles in place until there are n of them"""
+        current = self.get_num_rects()
+        if current == 0 or current >= n:
+            return self
+        index = (np.arange(n) * current) // n
+        self.x_values = self.x_values[index]
+        self.heights = self.heights[index]
+        self.alphas = self.alphas[index]
+        self.rgbs = self.rgbs[index]
+        for attr in ("fill_rgbas", "stroke_rgbas"):
+            rgbas = getattr(self, attr)
+            if len(rgbas) == current:
+                setattr(self, attr, rgbas[index])
+        points = self.points.reshape(current, POINTS_PER_RECT, 3)
+        self.set_points(points[index].reshape(-1, 3))
+        return self
+
+    def align_points(self, vmobject):
+        # Pair rectangles like a VGroup would, instead of collapsing the
+        # extra subpaths into a point
+        if isinstance(vmobject, RiemannRectangles):
+            n = max(self.get_num_rects(), vmobject.get_num_rects())
+            self.repeat_rects(n)
+            vmobject.repeat_rects(n)
+        return super().align_points(vmobject)
+
+    def follows_map(self):
+        """Whether the points are still those of the rectangle arrays, i.e. the
+        mobject wasn't moved or scaled since (the axes map is not updated)
+        """
+        if len(self.points) != len(self.x_values) * POINTS_PER_RECT:
+            return False
+        return np.allclose(self.points, self.get_rect_points())
+
+    def rect_rgbas(self, attr):
+        """fill_rgbas or stroke_rgbas with one row per rectangle"""
+        return stretch_array_to_length(getattr(self, attr), len(self.x_values))
+
+    def parent_index(self, x_values):
+        """Index of the rectangle containing each x, -1 where there is none"""
+        if not len(self.x_values):
+            return np.full(len(x_values), -1)
+        index = np.searchsorted(self.x_values, x_values, side="right") - 1
+        inside = (index >= 0) & (x_values < self.x_values[np.maximum(index, 0)] + self.dx)
+        return np.where(inside, index, -1)
+
+    def match_rects(self, rects):
+        """Take the rectangles, colors and points of another RiemannRectangles"""
+        for attr in ("x_values", "heights", "alphas", "rgbs", "fill_rgbas", "stroke_rgbas", "points"):
+            setattr(self, attr, getattr(rects, attr).copy())
+        self.dx = rects.dx
+        return self
+
+
+class RiemannRefinement(Animation):
+    """Animate RiemannRectangles into a finer or coarser set, on the arrays.
+
+    Each rectangle of the finer set is matched once to the rectangle of the
+    coarser set containing its middle. Refining, the finer rectangles start
+    side by side with the height and color of their parent and grow to
+    their own; coarsening goes the other way. Every frame only
+    interpolates heights and colors and rebuilds the points in one
+    vectorized pass, there is no point alignment between the two sets.
+    Rectangles without a parent (the coarse one was skipped for a negative
+    height) grow from the x axis.
+
+    Both sets must be from the same axes and not moved since they were
+    built, see can_refine.
+    """
+
+    def __init__(self, mobject, target, **kwargs):
+        self.target = target
+        super().__init__(mobject, **kwargs)
+
+    @staticmethod
+    def can_refine(mobject, target):
+        return (
+            isinstance(mobject, RiemannRectangles)
+            and isinstance(target, RiemannRectangles)
+            and np.allclose(
+                [mobject.origin, mobject.x_unit, mobject.y_unit],
+                [target.origin, target.x_unit, target.y_unit],
+            )
+            and mobject.follows_map()
+            and target.follows_map()
+        )
+
+    def begin(self):
+        start, end = self.mobject, self.target
+        refining = end.dx <= start.dx
+        fine, coarse = (end, start) if refining else (start, end)
+        parents = coarse.parent_index(fine.x_values + fine.dx / 2)
+        has_parent = parents >= 0
+        parents = np.maximum(parents, 0)
+
+        def projected(values, own):
+            # Value of each fine rectangle's parent, its own where it has none
+            if not len(values):
+                return own
+            mask = has_parent.reshape(-1, *[1] * (values.ndim - 1))
+            return np.where(mask, values[parents], own)
+
+        fine_state = {
+            "heights": fine.heights,
+            "fill_rgbas": fine.rect_rgbas("fill_rgbas"),
+            "stroke_rgbas": fine.rect_rgbas("stroke_rgbas"),
+        }
+        coarse_state = {
+            "heights": projected(coarse.heights, np.zeros_like(fine.heights)),
+            "fill_rgbas": projected(coarse.rect_rgbas("fill_rgbas"), fine_state["fill_rgbas"]),
+            "stroke_rgbas": projected(coarse.rect_rgbas("stroke_rgbas"), fine_state["stroke_rgbas"]),
+        }
+        self.start_state, self.end_state = (
+            (coarse_state, fine_state) if refining else (fine_state, coarse_state)
+        )
+        self.x_values = fine.x_values
+        self.width = fine.dx
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        state = {
+            key: interpolate(self.start_state[key], self.end_state[key], alpha)
+            for key in self.start_state
+        }
+        mobject = self.mobject
+        mobject.fill_rgbas = state["fill_rgbas"]
+        mobject.stroke_rgbas = state["stroke_rgbas"]
+        mobject.set_points(mobject.get_rect_points(self.x_values, self.width, state["heights"]))
+
+    def finish(self):
+        super().finish()
+        self.mobject.match_rects(self.target)
@@ -0,0 +1,127 @@
+"""Render one scene on every core by splitting its frames into shards.
+
+Usage:
+    python shard.py manimlogo.py LogoGeneration           # one shard per core
+    python shard.py re4lity.py Re4lityAdvanced -j 4
+
+Every worker replays construct() from the start with the same random seed,
+but only rasterizes and encodes the frames of its own shard. The shard
+movies are then joined in order without re-encoding.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from render_all import init_worker, output_file, render_scene, tile_workers
+
+
+def count_frames(script, scene_name, overrides=None):
+    """Replay the scene without rasterizing anything and return its frame count"""
+    from fastrender import ShardRenderer
+
+    scene, _ = render_scene(
+        script, scene_name,
+        {**(overrides or {}), "dry_run": True, "disable_caching": True},
+        renderer_class=ShardRenderer, shard=(0, 0),
+    )
+    return scene.renderer.frame_index
+
+
+def shard_ranges(num_frames, num_shards):
+    """Split [0, num_frames) into at most num_shards non-empty ranges"""
+    bounds = np.linspace(0, num_frames, min(num_shards, num_frames) + 1).astype(int)
+    return [(int(start), int(end)) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def render_shard(script, scene_name, index, shard, overrides=None):
+    """Render the frames of one shard into its own movie, return its path"""
+    from fastrender import ShardRenderer
+
+    scene, _ = render_scene(
+        script, scene_name,
+        {
+            **(overrides or {}),
+            "output_file": f"{scene_name}_shard{index:03d}",
+            "disable_caching": True,
+        },
+        stream=True,
+        renderer_class=ShardRenderer,
+        shard=shard,
+    )
+    return output_file(scene)
+
+
+def stitch(paths, output):
+    """Join the shard movies in order, copying the packets"""
+    import av
+
+    output = Path(output)
+    list_file = output.with_suffix(".shards.txt")
+    list_file.write_text(
+        "".join(f"file 'file:{Path(path).as_posix()}'\n" for path in paths),
+        encoding="utf-8",
+    )
+    try:
+        with av.open(str(list_file), format="concat", options={"safe": "0"}) as shards:
+            shard_stream = shards.streams.video[0]
+            with av.open(str(output), mode="w") as movie:
+                stream = movie.add_stream(template=shard_stream)
+                for packet in shards.demux(shard_stream):
+                    # Skip the flushing packets. The concat demuxer already
+                    # offsets the timestamps of each shard, B-frames need
+                    # the dts as they are
+                    if packet.dts is None:
+                        continue
+                    packet.stream = stream
+                    movie.mux(packet)
+    finally:
+        list_file.unlink(missing_ok=True)
+    return output
+
+
+def render_sharded(script, scene_name, jobs=None, overrides=None):
+    """Render a scene in shards on jobs processes, return the movie path"""
+    num_frames = count_frames(script, scene_name, overrides)
+    shards = shard_ranges(num_frames, jobs or os.cpu_count() or 1)
+    if not shards:
+        raise ValueError(f"{scene_name} has no frames to render")
+    print(f"{scene_name}: {num_frames} frames in {len(shards)} shards")
+    with ProcessPoolExecutor(
+        max_workers=len(shards), initializer=init_worker,
+        initargs=(None, tile_workers(len(shards))),
+    ) as pool:
+        futures = [
+            pool.submit(render_shard, str(script), scene_name, index, shard, overrides)
+            for index, shard in enumerate(shards)
+        ]
+        paths = [Path(future.result()) for future in futures]
+
+    movie = stitch(paths, paths[0].with_name(f"{scene_name}{paths[0].suffix}"))
+    for path in paths:
+        path.unlink(missing_ok=True)
+        path.with_suffix(".segments.json").unlink(missing_ok=True)
+    return movie
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script", help="scene script")
+    parser.add_argument("scene", help="scene class")
+    parser.add_argument("-j", "--jobs", type=int, help="number of shards (default: cores)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    script = Path(args.script).resolve()
+    init_worker(None)
+    print(f"Movie written to {render_sharded(script, args.scene, args.jobs)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+from functools import lru_cache
+
+from manim import *
+import numpy as np
+
+# Segments around the equator, the poles are segments / 2 rows apart
+LOD_SEGMENTS = (8, 12, 16, 24, 32, 48, 64)
+# Largest gap in pixels between the tessellated outline and the true circle
+MAX_OUTLINE_ERROR = 1.0
+LIGHT_DIRECTION = normalize(UL + OUT)
+
+
+@lru_cache(maxsize=None)
+def sphere_mesh(segments):
+    """Corners of the facets of a unit UV sphere, shape (facets, 4, 3)
+
+    The poles are on the y axis, the corners of every facet go around in
+    the same direction and the facets touching a pole are degenerate quads.
+    """
+    theta = np.linspace(0, PI, segments // 2 + 1)[:, None]
+    phi = np.linspace(0, TAU, segments + 1)[None, :]
+    grid = np.stack(np.broadcast_arrays(
+        np.sin(theta) * np.cos(phi), np.cos(theta), np.sin(theta) * np.sin(phi),
+    ), axis=-1)
+    corners = np.stack(
+        [grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]], axis=2,
+    )
+    # Facets of the top row start below the pole, so that no two facets
+    # start at the same point and run together as one subpath
+    corners[0] = np.roll(corners[0], 1, axis=1)
+    corners = corners.reshape(-1, 4, 3)
+    corners.flags.writeable = False
+    return corners
+
+
+def choose_lod(radius):
+    """Fewest segments keeping the outline within MAX_OUTLINE_ERROR on screen"""
+    radius_pixels = radius * config.pixel_width / config.frame_width
+    for segments in LOD_SEGMENTS:
+        # Distance from the middle of a facet edge to the circle
+        if radius_pixels * (1 - np.cos(PI / segments)) <= MAX_OUTLINE_ERROR:
+            return segments
+    return LOD_SEGMENTS[-1]
+
+
+def shade(normals, rgb, light_direction, ambient, diffuse, specular, shininess):
+    """Blinn-Phong color of every normal, for a viewer looking down -z"""
+    half = normalize(light_direction + OUT)
+    lambert = np.clip(normals @ light_direction, 0, None)
+    highlight = np.clip(normals @ half, 0, None) ** shininess
+    rgbs = rgb * (ambient + diffuse * lambert)[..., None] + specular * highlight[..., None]
+    return np.clip(rgbs, 0, 1)
+
+
+class ShadedSphere(VMobject):
+    """Sphere made of the visible facets of a tessellation, shaded per vertex.
+
+    The tessellation is picked from the size of the sphere on screen and
+    cached per level of detail, the lighting is computed for all vertices at
+    once. Each facet is one subpath colored through vertex_rgbas, FastCamera
+    draws them as one smooth mesh pattern (any other camera uses the flat
+    fill color). rotate() turns the sphere itself, the light stays in place.
+    The sphere is reshaded only when rotated directly: rotating a group that
+    contains it turns its flat facets through apply_points_function instead.
+    """
+
+    def __init__(
+        self, radius=1.0, color=BLUE, fill_opacity=1.0, lod=None,
+        light_direction=LIGHT_DIRECTION, ambient=0.35, diffuse=0.65,
+        specular=0.35, shininess=20, **kwargs,
+    ):
+        super().__init__(fill_color=color, fill_opacity=fill_opacity, stroke_width=0, **kwargs)
+        self.radius = radius
+        self.base_rgb = color_to_rgb(color)
+        self.lod = lod or choose_lod(radius)
+        self.light_direction = np.asarray(light_direction, dtype=float)
+        self.ambient = ambient
+        self.diffuse = diffuse
+        self.specular = specular
+        self.shininess = shininess
+        self.orientation = np.identity(3)
+        self.shade_mesh(ORIGIN)
+
+    def shade_mesh(self, center):
+        """Rebuild the points and vertex colors of the front facets around center"""
+        corners = sphere_mesh(self.lod) @ self.orientation.T
+        # Orthographic view from +z, the back half is hidden
+        corners = corners[corners[:, :, 2].mean(axis=1) > 0]
+        rgbs = shade(
+            corners, self.base_rgb, self.light_direction,
+            self.ambient, self.diffuse, self.specular, self.shininess,
+        )
+        # Each edge is a straight cubic curve from one corner to the next
+        t = np.linspace(0, 1, 4)[:, None]
+
+        def edges(values):
+            ends = np.roll(values, -1, axis=1)
+            return (values[:, :, None] + t * (ends - values)[:, :, None]).reshape(-1, values.shape[-1])
+
+        flat = np.array([1.0, 1.0, 0.0])
+        self.unit_points = edges(corners) * flat
+        self.set_points(center + self.radius * self.unit_points)
+        self.vertex_rgbas = np.hstack([edges(rgbs), np.ones((len(self.points), 1))])
+        return self
+
+    def get_placement(self):
+        """(center, radius) of the sphere as it is now, moved or scaled since
+        shade_mesh, by least squares of the points against the unit mesh
+        """
+        unit = self.unit_points
+        if len(unit) != len(self.points):
+            return self.get_center(), self.radius
+        unit_mean = unit.mean(axis=0)
+        points_mean = self.points.mean(axis=0)
+        du = unit - unit_mean
+        radius = (du * (self.points - points_mean)).sum() / (du * du).sum()
+        return points_mean - radius * unit_mean, radius
+
+    def rotate(self, angle, axis=OUT, about_point=None, **kwargs):
+        rotation = rotation_matrix(angle, axis)
+        center, self.radius = self.get_placement()
+        if about_point is not None:
+            center = about_point + rotation @ (center - about_point)
+        self.orientation = rotation @ self.orientation
+        return self.shade_mesh(center)
+
+    def refresh_lod(self):
+        """Pick the level of detail again after the sphere was scaled"""
+        center, self.radius = self.get_placement()
+        self.lod = choose_lod(self.radius)
+        return self.shade_mesh(center)
@@ -0,0 +1,60 @@
+from manim import *
+from manim.animation.transform import _MethodAnimation
+from manim.mobject.mobject import _AnimationBuilder
+import numpy as np
+
+
+def same_points(*mobjects):
+    """Whether the mobjects all have the same points"""
+    first = mobjects[0].points
+    return all(
+        mobject.points is first or np.array_equal(mobject.points, first)
+        for mobject in mobjects[1:]
+    )
+
+
+class StyleMethodAnimation(_MethodAnimation):
+    """`.animate` animation that leaves the points alone when only the style changes.
+
+    After the usual alignment, begin() checks once whether every family
+    member has the same points in the mobject, its start and its target.
+    If so each frame only runs interpolate_color (colors, opacities,
+    widths, and the layers of GlowGlyph), the points keep their array and
+    FastCamera reuses the cairo path it cached for them.
+    """
+
+    style_only = False
+
+    def begin(self):
+        super().begin()
+        self.style_only = config.renderer == RendererType.CAIRO and all(
+            same_points(*family) for family in self.get_all_families_zipped()
+        )
+
+    def interpolate_submobject(self, submobject, starting_submobject, target_copy, alpha):
+        if not self.style_only:
+            return super().interpolate_submobject(
+                submobject, starting_submobject, target_copy, alpha,
+            )
+        submobject.interpolate_color(starting_submobject, target_copy, alpha)
+        return self
+
+
+class StyleAnimationBuilder(_AnimationBuilder):
+    """_AnimationBuilder that builds a StyleMethodAnimation"""
+
+    def build(self):
+        if self.overridden_animation:
+            return super().build()
+        animation = StyleMethodAnimation(self.mobject, self.methods)
+        for attr, value in self.anim_args.items():
+            setattr(animation, attr, value)
+        return animation
+
+
+class StyleAnimateMixin:
+    """Mobjects whose `.animate` skips the points of style-only changes"""
+
+    @property
+    def animate(self):
+        return StyleAnimationBuilder(self)
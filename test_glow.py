@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cairo")
+
+from manim import *  # noqa: E402
+
+from fastrender import FastScene  # noqa: E402
+from glow import GlowText, fill_layer, stroke_layer  # noqa: E402
+
+GLOW, FILL = range(2)
+
+
+class StaggeredGlyph(FastScene):
+    """Animates the middle glyph of overlapping glow glyphs without changing
+    their look, then holds the same picture in a wait
+    """
+
+    def construct(self):
+        glyphs = VGroup(*[Square(1).shift(0.6 * i * RIGHT) for i in range(3)])
+        text = GlowText(glyphs, [stroke_layer(YELLOW, 15, opacity=0.5), fill_layer(BLUE)])
+        self.add(Dot(LEFT * 3), text)
+        self.frames = []
+        add_frame = self.renderer.add_frame
+
+        def record(frame, num_frames=1):
+            self.frames.append(np.array(frame))
+            return add_frame(frame, num_frames)
+
+        self.renderer.add_frame = record
+        self.play(text[1].animate.set_layer(GLOW, opacity=0.5), run_time=0.2)
+        self.wait(0.2)
+
+
+def test_animated_glyph_matches_static_frame():
+    with tempconfig({
+        "dry_run": True, "pixel_width": 320, "pixel_height": 180, "frame_rate": 10,
+    }):
+        scene = StaggeredGlyph()
+        scene.render()
+    *play_frames, static_frame = scene.frames
+    assert play_frames
+    for frame in play_frames:
+        np.testing.assert_array_equal(frame, static_frame)
@@ -0,0 +1,167 @@
+from manim import *
+from manim.animation.animation import prepare_animation
+from manim.animation.transform import _MethodAnimation
+import numpy as np
+
+# Idle time shorter than this stays inside a pass, longer idle time is
+# played as a wait, which manim renders from one frozen frame
+MIN_WAIT = 0.5
+
+
+class TimelinePass(AnimationGroup):
+    """AnimationGroup with explicit start times instead of a lag_ratio.
+
+    Animations are begun when their start time is reached, so one that
+    follows another on the same mobject starts from where the first one
+    left it. `.animate` targets are rebuilt at that point for the same reason.
+    """
+
+    def __init__(self, *animations, starts, run_time=None, **kwargs):
+        self.starts = np.asarray(starts, dtype=float)
+        super().__init__(*animations, run_time=run_time, rate_func=linear, **kwargs)
+        # Idle time at the end is part of the pass, not a stretch of it
+        self.max_end_time = self.run_time
+
+    def build_animations_with_timings(self):
+        super().build_animations_with_timings()
+        awt = self.anims_with_timings
+        run_times = awt["end"] - awt["start"]
+        awt["start"] = self.starts
+        awt["end"] = self.starts + run_times
+
+    def begin(self):
+        if not self.animations:
+            raise ValueError(f"Trying to play {self} without animations.")
+        self.anim_group_time = 0.0
+        if self.suspend_mobject_updating:
+            self.group.suspend_updating()
+        # Introducers don't depend on earlier animations, and begun now they
+        # stay hidden until their start instead of popping in
+        for index, anim in enumerate(self.animations):
+            if anim.is_introducer():
+                self.begin_animation(index)
+
+    def begin_animation(self, index):
+        anim = self.animations[index]
+        if isinstance(anim, _MethodAnimation):
+            anim.target_mobject = anim.mobject.copy()
+            for method, method_args, method_kwargs in anim.methods:
+                method.__func__(anim.target_mobject, *method_args, **method_kwargs)
+        anim.begin()
+        self.anims_begun[index] = True
+
+    def update_running(self, time):
+        awt = self.anims_with_timings
+        for index in np.flatnonzero(self.anims_begun & ~self.anims_finished):
+            anim, start, end = awt[index]
+            if time < start:
+                continue
+            anim.interpolate(1 if end <= start else min(1, (time - start) / (end - start)))
+            if time >= end:
+                anim.finish()
+                self.anims_finished[index] = True
+
+    def interpolate(self, alpha):
+        time = alpha * self.max_end_time
+        starting = ~self.anims_begun & (self.starts <= time)
+        # Animations are sorted by start: bring the running ones to each
+        # start before the next animation takes its starting state
+        for index in np.flatnonzero(starting):
+            self.update_running(self.starts[index])
+            self.begin_animation(index)
+        self.update_running(time)
+        self.anim_group_time = time
+
+    def finish(self):
+        self.interpolate(1)
+        if self.suspend_mobject_updating:
+            self.group.resume_updating()
+
+
+class Timeline:
+    """Animations placed at start times, compiled into as few plays as possible.
+
+    timeline = Timeline()
+    for i, glyph in enumerate(text):
+        timeline.add(glyph.animate.set_opacity(1), at=i * 0.2, run_time=0.6)
+    timeline.wait(2)
+    timeline.play(scene)
+
+    Animations of the same mobject may follow each other anywhere on the
+    timeline but must not overlap in time. Each pass is one play, hence one
+    cached segment for SegmentCacheWriter: editing any animation of a pass
+    renders the whole pass again.
+    """
+
+    def __init__(self):
+        self.entries = []  # (start, end, animation)
+        self.end = 0.0
+
+    def add(self, *animations, at=None, run_time=None, lag=0.0):
+        """Start the animations at `at` (default: end of the timeline), `lag` seconds apart"""
+        start = self.end if at is None else at
+        for i, animation in enumerate(animations):
+            animation = prepare_animation(animation)
+            if run_time is not None:
+                animation.run_time = run_time
+            begin = start + i * lag
+            self.entries.append((begin, begin + animation.run_time, animation))
+            self.end = max(self.end, begin + animation.run_time)
+        return self
+
+    def wait(self, duration):
+        self.end += duration
+        return self
+
+    def check_overlaps(self):
+        busy = {}  # mobject id -> (end, animation) of its last animation
+        for start, end, animation in sorted(self.entries, key=lambda e: e[0]):
+            for mobject in animation.mobject.get_family():
+                previous = busy.get(id(mobject))
+                if previous is not None and previous[0] > start:
+                    raise ValueError(
+                        f"{animation} starts at {start:g}s while {previous[1]} "
+                        f"still animates the same mobject"
+                    )
+                busy[id(mobject)] = (end, animation)
+
+    def compile(self):
+        """Return the plays in order, a TimelinePass or a float for a wait"""
+        self.check_overlaps()
+        plays = []
+        batch = []
+        pass_start = pass_end = 0.0
+        for start, end, animation in sorted(self.entries, key=lambda e: e[0]):
+            if start - pass_end >= MIN_WAIT:
+                if batch:
+                    plays.append(self.make_pass(batch, pass_start, pass_end))
+                    batch = []
+                plays.append(start - pass_end)
+                pass_start = pass_end = start
+            batch.append((start, animation))
+            pass_end = max(pass_end, end)
+        if batch and self.end - pass_end < MIN_WAIT:
+            # A short idle tail is rendered with the last pass
+            pass_end = self.end
+        if batch:
+            plays.append(self.make_pass(batch, pass_start, pass_end))
+        if self.end > pass_end:
+            plays.append(self.end - pass_end)
+        return plays
+
+    @staticmethod
+    def make_pass(batch, pass_start, pass_end):
+        starts, animations = zip(*batch)
+        return TimelinePass(
+            *animations,
+            starts=np.array(starts) - pass_start,
+            run_time=pass_end - pass_start,
+        )
+
+    def play(self, scene):
+        """Play the compiled timeline in the scene"""
+        for play in self.compile():
+            if isinstance(play, TimelinePass):
+                scene.play(play)
+            else:
+                scene.wait(play)
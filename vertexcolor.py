@@ -0,0 +1,74 @@
+from manim import *
+from manim.utils.iterables import stretch_array_to_length
+import numpy as np
+
+
+def has_vertex_colors(vmobject):
+    """Whether the VMobject has one RGBA per point"""
+    rgbas = getattr(vmobject, "vertex_rgbas", None)
+    return rgbas is not None and 0 < len(rgbas) == len(vmobject.points)
+
+
+def set_color_by_function(mobject, func, family=True):
+    """Color every point of the VMobjects by func(points).
+
+    func takes an (n, 3) array and returns (n, 3) RGB or (n, 4) RGBA, it is
+    called once on the points of the whole family. The colors are stored as
+    vertex_rgbas, interpolated along each curve by FastCamera and carried
+    through alignment.PlannedTransform. Fill and stroke opacity still apply
+    on top of the alpha of each vertex.
+    """
+    mobjects = [
+        mob for mob in (mobject.family_members_with_points() if family else [mobject])
+        if isinstance(mob, VMobject)
+    ]
+    if not mobjects:
+        return mobject
+    points = np.concatenate([mob.points for mob in mobjects])
+    rgbas = np.asarray(func(points), dtype=float).reshape(len(points), -1)
+    if rgbas.shape[1] == 3:
+        rgbas = np.hstack([rgbas, np.ones((len(rgbas), 1))])
+    sizes = np.cumsum([len(mob.points) for mob in mobjects])[:-1]
+    for mob, mob_rgbas in zip(mobjects, np.split(rgbas, sizes)):
+        mob.vertex_rgbas = mob_rgbas
+    return mobject
+
+
+def color_conditions(default, *conditions):
+    """Vectorized color function, conditions are (func(points) -> mask, color) pairs.
+
+    A point takes the color of the last condition it meets, default otherwise.
+    """
+    def color_points(points):
+        rgbas = np.tile(color_to_rgba(default), (len(points), 1))
+        for condition, color in conditions:
+            rgbas[condition(points)] = color_to_rgba(color)
+        return rgbas
+
+    return color_points
+
+
+def default_vertex_rgbas(vmobject):
+    """Vertex colors of a VMobject without any, from its fill or else its stroke"""
+    rgbas = vmobject.fill_rgbas if vmobject.fill_rgbas[:, 3].any() else vmobject.stroke_rgbas
+    rgba = np.append(rgbas[0, :3], 1.0)
+    return np.tile(rgba, (len(vmobject.points), 1))
+
+
+def fit_vertex_colors(vmobject):
+    """Make vertex_rgbas match the points again, after they were changed"""
+    if not isinstance(vmobject, VMobject) or not vmobject.has_points():
+        return
+    rgbas = getattr(vmobject, "vertex_rgbas", None)
+    if rgbas is None or not len(rgbas):
+        vmobject.vertex_rgbas = default_vertex_rgbas(vmobject)
+    elif len(rgbas) != len(vmobject.points):
+        vmobject.vertex_rgbas = stretch_array_to_length(rgbas, len(vmobject.points))
+
+
+def interpolate_vertex_colors(vmobject, start, end, alpha):
+    if has_vertex_colors(start) and has_vertex_colors(end) and len(start.points) == len(end.points):
+        vmobject.vertex_rgbas = (
+            end.vertex_rgbas.copy() if alpha == 1
+            else interpolate(start.vertex_rgbas, end.vertex_rgbas, alpha)
+        )
@@ -0,0 +1,401 @@
+import json
+import os
+from queue import Queue
+from threading import Condition, Thread
+
+import av
+from manim import *
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_gif_format, write_to_movie
+from PIL import Image
+
+from diskcache import DiskCache
+
+SEGMENT_CACHE_BYTES = 4 * 1024 ** 3
+# Frame buffers shared by FastRenderer and the writer thread: the frame
+# being rasterized, the one held by the writer and two queued for encoding
+FRAME_RING_SIZE = 4
+# Frames sampled across the scene for the GIF palette, and their pixel stride
+GIF_PALETTE_FRAMES = 32
+GIF_PALETTE_STRIDE = 4
+# Shortest GIF delay in 1/100 s, players slow shorter ones down to 1/10 s
+GIF_MIN_DELAY = 2
+# Amplitude of the ordered dither, in 8-bit levels
+GIF_DITHER = 12
+BAYER_8 = np.array([
+    [0, 32, 8, 40, 2, 34, 10, 42],
+    [48, 16, 56, 24, 50, 18, 58, 26],
+    [12, 44, 4, 36, 14, 46, 6, 38],
+    [60, 28, 52, 20, 62, 30, 54, 22],
+    [3, 35, 11, 43, 1, 33, 9, 41],
+    [51, 19, 59, 27, 49, 17, 57, 25],
+    [15, 47, 7, 39, 13, 45, 5, 37],
+    [63, 31, 55, 23, 61, 29, 53, 21],
+]) / 64 - 0.5
+
+
+class FrameRing:
+    """Fixed set of frame buffers passed from the renderer to the writer thread.
+
+    The renderer copies each new frame into a free buffer instead of a new
+    array, and waits when every buffer is still waiting for the encoder:
+    memory stays at size frames however far rasterizing gets ahead. Each
+    holder (the renderer, every queued write, the writer's held frame)
+    retains the buffer, which is reused once they all released it.
+
+    acquire() returns a new view on the buffer each time, so a frame written
+    again is still the same array and a new frame never is.
+    """
+
+    def __init__(self, size=FRAME_RING_SIZE):
+        self.size = size
+        self.buffers = []
+        self.holders = {}
+        self.closed = False
+        self.condition = Condition()
+
+    def buffer_key(self, frame):
+        base = getattr(frame, "base", None)
+        return id(base) if base is not None and id(base) in self.holders else None
+
+    def acquire(self, shape, dtype):
+        """A frame to draw into, held once by the caller"""
+        with self.condition:
+            while not self.closed:
+                free = [buffer for buffer in self.buffers if not self.holders[id(buffer)]]
+                if not free and len(self.buffers) < self.size:
+                    free = [np.empty(shape, dtype)]
+                    self.buffers.append(free[0])
+                if free:
+                    buffer = free[0]
+                    if buffer.shape != shape or buffer.dtype != dtype:
+                        self.buffers.remove(buffer)
+                        del self.holders[id(buffer)]
+                        buffer = np.empty(shape, dtype)
+                        self.buffers.append(buffer)
+                    self.holders[id(buffer)] = 1
+                    return buffer[...]
+                self.condition.wait()
+        return np.empty(shape, dtype)
+
+    def retain(self, frame):
+        key = self.buffer_key(frame)
+        if key is not None:
+            with self.condition:
+                self.holders[key] += 1
+
+    def release(self, frame):
+        key = self.buffer_key(frame)
+        if key is not None:
+            with self.condition:
+                self.holders[key] -= 1
+                self.condition.notify_all()
+
+    def close(self):
+        """Stop reusing buffers, acquire() allocates from now on"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+class HeldFrameWriter(SceneFileWriter):
+    """SceneFileWriter that converts a held frame to the stream format once.
+
+    manim converts every frame from RGBA to the stream's pixel format, also
+    when the same frame is written 120 times for a 2 second wait. Here a
+    frame written again (same array, as FastRenderer and waits do) reuses
+    its converted planes, only the copy into a new VideoFrame is repeated.
+
+    Frames from FastRenderer come from the writer's frame_ring and are given
+    back once encoded.
+    """
+
+    # Formats that PyAV can build a VideoFrame from directly
+    held_pix_fmts = ("yuv420p",)
+
+    held_frame = None
+    held_planes = None
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.frame_ring = FrameRing()
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if write_to_movie():
+            # Released by the writer thread once encoded
+            self.frame_ring.retain(frame_or_renderer)
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def listen_and_write(self):
+        while True:
+            num_frames, frame = self.queue.get()
+            if frame is None:
+                break
+            try:
+                self.encode_and_write_frame(frame, num_frames)
+            except BaseException:
+                # Nothing will release the queued frames anymore
+                self.frame_ring.close()
+                raise
+            self.frame_ring.release(frame)
+
+    def hold(self, frame):
+        """Make frame the held frame, its ring buffer is kept until the next one"""
+        self.frame_ring.retain(frame)
+        self.frame_ring.release(self.held_frame)
+        self.held_frame = frame
+
+    def encode_and_write_frame(self, frame, num_frames):
+        pix_fmt = self.video_stream.pix_fmt
+        if pix_fmt not in self.held_pix_fmts:
+            return super().encode_and_write_frame(frame, num_frames)
+        if frame is not self.held_frame:
+            self.hold(frame)
+            self.held_planes = (
+                av.VideoFrame.from_ndarray(frame, format="rgba")
+                .reformat(format=pix_fmt)
+                .to_ndarray()
+            )
+        for _ in range(num_frames):
+            # A VideoFrame can't be encoded twice, see
+            # SceneFileWriter.encode_and_write_frame
+            av_frame = av.VideoFrame.from_ndarray(self.held_planes, format=pix_fmt)
+            for packet in self.video_stream.encode(av_frame):
+                self.video_container.mux(packet)
+
+
+class SegmentCacheWriter(HeldFrameWriter):
+    """SceneFileWriter whose partial movies are a size-bounded LRU cache.
+
+    manim names each play/wait segment after a hash of the scene state going
+    in plus the animations, so an edit misses the cache from the changed
+    segment on and everything before it is reused. manim keeps the newest
+    max_files_cached files though, which evicts the segments reused the most;
+    here a hit refreshes the file and the least recently used bytes go first.
+    """
+
+    max_bytes = SEGMENT_CACHE_BYTES
+
+    def segment_cache(self):
+        cache = DiskCache(self.partial_movie_directory, self.max_bytes)
+        cache.suffix = config["movie_file_extension"]
+        return cache
+
+    def is_already_cached(self, hash_invocation):
+        if not super().is_already_cached(hash_invocation):
+            return False
+        try:
+            os.utime(self.segment_cache().path(hash_invocation))  # LRU
+        except FileNotFoundError:
+            # Evicted by another render since the check: a miss
+            return False
+        return True
+
+    def clean_cache(self):
+        # The segments of this render are never evicted by it
+        self.segment_cache().evict(keep=[
+            path for path in self.partial_movie_files if path is not None
+        ])
+
+
+class StreamingFileWriter(HeldFrameWriter):
+    """SceneFileWriter that encodes the whole scene in one stream.
+
+    Frames of every play/wait go straight into the final movie, with no
+    partial movie files and no concat step. Segment boundaries are written
+    next to the movie as <movie>.segments.json. Nothing is reused between
+    renders, and sound and sections are not written.
+    """
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.check_format()
+        self.video_container = None
+        self.segments = []
+        self.segment_hash = None
+        self.segment_start = 0
+        self.frames_written = 0
+
+    def check_format(self):
+        if write_to_movie() and is_gif_format():
+            raise ValueError("StreamingFileWriter writes movies, not gifs")
+
+    @property
+    def stream_file_path(self):
+        # Renamed to the movie once complete, an aborted render leaves the
+        # previous movie in place
+        path = self.movie_file_path
+        return path.with_name(f"{path.stem}_stream{path.suffix}")
+
+    @property
+    def segments_file_path(self):
+        return self.movie_file_path.with_suffix(".segments.json")
+
+    def is_already_cached(self, hash_invocation):
+        # Every segment is encoded in this pass
+        return False
+
+    def add_partial_movie_file(self, hash_animation):
+        self.segment_hash = hash_animation
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write:
+            if self.video_container is None:
+                self.open_partial_movie_stream(file_path=str(self.stream_file_path))
+            self.segment_start = self.frames_written
+
+    def end_animation(self, allow_write=False):
+        if write_to_movie() and allow_write:
+            self.segments.append({
+                "index": self.renderer.num_plays,
+                "hash": self.segment_hash,
+                "start_frame": self.segment_start,
+                "end_frame": self.frames_written,
+            })
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        super().write_frame(frame_or_renderer, num_frames)
+        if write_to_movie():
+            self.frames_written += num_frames
+
+    def finish(self):
+        if not write_to_movie():
+            return super().finish()
+        if self.video_container is None:
+            logger.info("No animations are contained in this scene.")
+        else:
+            self.close_movie_stream()
+            if self.includes_sound:
+                logger.warning("StreamingFileWriter does not write sound")
+            self.print_file_ready_message(self.movie_file_path)
+        if self.subcaptions:
+            self.write_subcaption_file()
+
+    def close_movie_stream(self):
+        """Flush the encoder, move the movie in place and write the segments"""
+        self.queue.put((-1, None))
+        self.writer_thread.join()
+        self.flush_stream()
+        os.replace(self.stream_file_path, self.movie_file_path)
+
+        frame_rate = config["frame_rate"]
+        self.segments_file_path.write_text(json.dumps({
+            "frame_rate": frame_rate,
+            "segments": [
+                {
+                    **segment,
+                    "start_time": segment["start_frame"] / frame_rate,
+                    "end_time": segment["end_frame"] / frame_rate,
+                }
+                for segment in self.segments
+            ],
+        }, indent=2), encoding="utf-8")
+
+    def flush_stream(self):
+        for packet in self.video_stream.encode():
+            self.video_container.mux(packet)
+        self.video_container.close()
+
+
+def ordered_dither(rgb, amplitude=GIF_DITHER):
+    """Add a Bayer threshold pattern, which stays put from one frame to the next"""
+    height, width = rgb.shape[:2]
+    pattern = np.tile(BAYER_8, (height // 8 + 1, width // 8 + 1))[:height, :width, None]
+    return np.clip(rgb + amplitude * pattern, 0, 255).astype(np.uint8)
+
+
+def gif_timing(frame_counts, frame_rate):
+    """Indices of the frames to write and their delays in ms.
+
+    GIF delays are in 1/100 s: frame starts are rounded to that clock, and a
+    frame starting less than GIF_MIN_DELAY after the previous one is dropped.
+    """
+    starts = np.round(np.cumsum([0, *frame_counts]) * 100 / frame_rate).astype(int)
+    kept = [0]
+    delays = []
+    for index in range(1, len(frame_counts)):
+        if starts[index] - starts[kept[-1]] >= GIF_MIN_DELAY:
+            delays.append(starts[index] - starts[kept[-1]])
+            kept.append(index)
+    delays.append(max(GIF_MIN_DELAY, starts[-1] - starts[kept[-1]]))
+    return kept, [10 * int(delay) for delay in delays]
+
+
+class GifFileWriter(StreamingFileWriter):
+    """StreamingFileWriter for GIFs, with one palette per scene.
+
+    Distinct frames are spooled to disk as RGB, a held frame (the same
+    array, or equal to the previous frame) only makes the previous delay
+    longer. At the end, one palette is built from frames sampled across the
+    scene, every frame is quantized to it with an ordered dither, which
+    doesn't flicker between frames, and Pillow writes only the rectangle
+    that changed since the previous frame. Transparency is not kept.
+    """
+
+    colors = 256
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        if write_to_movie():
+            self.movie_file_path = self.gif_file_path
+        self.frame_counts = []
+
+    def check_format(self):
+        if write_to_movie() and not is_gif_format():
+            raise ValueError("GifFileWriter writes gifs, render with --format=gif")
+
+    @property
+    def spool_file_path(self):
+        return self.stream_file_path.with_suffix(".rgb")
+
+    def open_partial_movie_stream(self, file_path=None):
+        self.video_container = open(self.spool_file_path, "wb")
+        self.queue = Queue()
+        self.writer_thread = Thread(target=self.listen_and_write, args=())
+        self.writer_thread.start()
+
+    def encode_and_write_frame(self, frame, num_frames):
+        if self.frame_counts and (
+            frame is self.held_frame or np.array_equal(frame, self.held_frame)
+        ):
+            self.frame_counts[-1] += num_frames
+            return
+        # Kept from the ring, the next frame is compared with it
+        self.hold(frame)
+        self.video_container.write(np.ascontiguousarray(frame[:, :, :3]).tobytes())
+        self.frame_counts.append(num_frames)
+
+    def flush_stream(self):
+        self.video_container.close()
+        try:
+            frames = np.memmap(
+                self.spool_file_path, dtype=np.uint8, mode="r",
+                shape=(len(self.frame_counts), config.pixel_height, config.pixel_width, 3),
+            )
+            self.write_gif(frames, self.stream_file_path)
+            del frames
+        finally:
+            self.spool_file_path.unlink(missing_ok=True)
+
+    def build_palette(self, frames):
+        """Palette image from pixels of frames sampled across the scene"""
+        indices = np.linspace(0, len(frames) - 1, min(len(frames), GIF_PALETTE_FRAMES))
+        samples = frames[indices.astype(int), ::GIF_PALETTE_STRIDE, ::GIF_PALETTE_STRIDE]
+        samples = samples.reshape(-1, samples.shape[2], 3)
+        return Image.fromarray(samples).quantize(
+            colors=self.colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE,
+        )
+
+    def write_gif(self, frames, path):
+        palette = self.build_palette(frames)
+        kept, delays = gif_timing(self.frame_counts, config.frame_rate)
+        images = (
+            Image.fromarray(ordered_dither(frames[index])).quantize(
+                palette=palette, dither=Image.Dither.NONE,
+            )
+            for index in kept
+        )
+        next(images).save(
+            path, format="GIF", save_all=True, append_images=images,
+            duration=delays, loop=0, disposal=1, optimize=False,
+        )